@@ -0,0 +1,158 @@
+# _netutils.py
+"""
+legacy 脚本共用的网络请求工具
+"""
+
+import functools
+import json
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from PyQt6.QtCore import QObject
+from PyQt6.QtCore import QRunnable
+from PyQt6.QtCore import pyqtSignal
+
+
+try:
+    import orjson
+except ImportError:  # 未安装 orjson 时退回标准库 json
+    orjson = None
+
+
+# 所有请求都发往同一主机，共享会话以复用 keep-alive 连接，避免重复 TLS 握手。
+# requests 导入较重，推迟到第一次发请求时再创建会话。
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """获取共享会话，首次调用时才导入 requests 并创建"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=20))
+                # 与 AuthClient 保持一致的固定 UA，便于在 Worker 侧按 UA 放行
+                session.headers["User-Agent"] = "MyQt6App/1.0"
+                _session = session
+    return _session
+
+
+# 请求体自行序列化为 bytes 后发送，需要显式声明类型
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def dumps_json(obj):
+    """序列化为 UTF-8 编码的 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def loads_json(data):
+    """解析 JSON（bytes 或 str），格式错误时抛出 json.JSONDecodeError"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_pretty(obj):
+    """格式化为缩进 2 格、保留中文的 JSON 文本，用于界面展示"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def throttled(timeout=500):
+    """节流装饰器：同一窗口在 timeout 毫秒内只响应第一次调用
+
+    用于按钮点击槽函数，连续点击时后续调用直接丢弃，信号附带的参数
+    （如 clicked 的 checked）会被忽略。
+    """
+
+    def decorator(func):
+        attr = f"_last_{func.__name__}_call"
+
+        @functools.wraps(func)
+        def wrapper(self, *_):
+            now = time.monotonic()
+            last = getattr(self, attr, None)
+            if last is not None and (now - last) * 1000 < timeout:
+                return None
+            setattr(self, attr, now)
+            return func(self)
+
+        return wrapper
+
+    return decorator
+
+
+@dataclass(frozen=True)
+class LoginResult:
+    """登录接口的解析结果，在工作线程中构造后整体发送给界面线程"""
+
+    display_name: str
+    token: Optional[str] = None
+
+    @classmethod
+    def from_response(cls, result):
+        """从登录接口返回的 JSON 构造结果对象"""
+        user_info = result.get("user") or {}
+        return cls(display_name=user_info.get("display_name") or "用户", token=result.get("token"))
+
+
+class NetworkSignals(QObject):
+    """网络请求任务的信号（QRunnable 不是 QObject，不能直接定义信号）"""
+
+    # 未指定解析函数时发送原始 dict，否则发送解析后的对象
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+
+class NetworkTask(QRunnable):
+    """网络请求任务，由线程池中的线程执行"""
+
+    def __init__(self, url, data, request_type="POST", session=None, parse=None):
+        super().__init__()
+        self.url = url
+        self.data = data
+        self.request_type = request_type
+        # 未指定会话时在工作线程中获取共享会话
+        self.session = session
+        # 可选的响应解析函数，在工作线程中执行
+        self.parse = parse
+        self.signals = NetworkSignals()
+
+    def run(self):
+        from requests.exceptions import RequestException
+
+        session = self.session or get_session()
+        try:
+            if self.request_type == "POST":
+                response = session.post(self.url, data=dumps_json(self.data), headers=JSON_HEADERS, timeout=10)
+            else:
+                response = session.get(self.url, timeout=10)
+
+            if response.status_code == 200:
+                result = loads_json(response.content)
+                if self.parse is not None:
+                    result = self.parse(result)
+                self.signals.finished.emit(result)
+            else:
+                error_data = loads_json(response.content) if response.content else {}
+                error_msg = error_data.get("error", f"HTTP {response.status_code}")
+                self.signals.error.emit(error_msg)
+
+        except json.JSONDecodeError:
+            # orjson 与 requests 的解析异常均继承自 json.JSONDecodeError
+            self.signals.error.emit("服务器响应格式错误")
+        except RequestException as e:
+            self.signals.error.emit(f"网络请求失败: {str(e)}")
+        except Exception as e:
+            self.signals.error.emit(f"未知错误: {str(e)}")
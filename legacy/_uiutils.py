@@ -0,0 +1,36 @@
+# _uiutils.py
+"""
+legacy 脚本共用的界面工具
+"""
+
+from qfluentwidgets import InfoBar, InfoBarPosition
+
+
+class InfoBarMixin:
+    """窗口内同一时间只保留一个 InfoBar
+
+    新消息到来时先关闭上一条，避免连续报错时堆叠出大量提示控件。
+    需与 QWidget 一起继承，并放在 QWidget 之前。
+    """
+
+    _info_bar = None
+
+    def _show_info(self, level, title, content, duration=2000):
+        """显示提示信息，level 为 'success' / 'error' / 'warning' / 'info'"""
+        if self._info_bar is not None:
+            self._info_bar.close()
+
+        bar = getattr(InfoBar, level)(
+            title=title,
+            content=content,
+            duration=duration,
+            parent=self,
+            position=InfoBarPosition.TOP
+        )
+        bar.closedSignal.connect(self._on_info_bar_closed)
+        self._info_bar = bar
+
+    def _on_info_bar_closed(self):
+        """提示条关闭后释放引用（仅当关闭的是当前这一条时）"""
+        if self.sender() is self._info_bar:
+            self._info_bar = None
@@ -1,70 +1,37 @@
 # login_app.py
 
 import sys
-import json
-import requests
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QThreadPool
 from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout
 
 # 导入 fluent-widgets 的核心组件
 from qfluentwidgets import (
-    setTheme, Theme, TitleLabel, LineEdit, PasswordLineEdit,
-    PrimaryPushButton, CheckBox, HyperlinkButton, InfoBar,
-    InfoBarPosition
+    setTheme, Theme, TitleLabel, LineEdit, PasswordLineEdit, PrimaryPushButton,
+    CheckBox, HyperlinkButton
 )
 
+from _netutils import LoginResult, NetworkTask, throttled
+from _uiutils import InfoBarMixin
 
-class NetworkWorker(QThread):
-    """网络请求工作线程"""
-    finished = pyqtSignal(dict)
-    error = pyqtSignal(str)
-    
-    def __init__(self, url, data, request_type='POST'):
-        super().__init__()
-        self.url = url
-        self.data = data
-        self.request_type = request_type
-    
-    def run(self):
-        try:
-            headers = {'Content-Type': 'application/json'}
-            
-            if self.request_type == 'POST':
-                response = requests.post(
-                    self.url, 
-                    data=json.dumps(self.data), 
-                    headers=headers,
-                    timeout=10
-                )
-            else:
-                response = requests.get(self.url, headers=headers, timeout=10)
-            
-            if response.status_code == 200:
-                result = response.json()
-                self.finished.emit(result)
-            else:
-                error_data = response.json() if response.content else {}
-                error_msg = error_data.get(
-                    'error', f'HTTP {response.status_code}'
-                )
-                self.error.emit(error_msg)
-                
-        except requests.exceptions.RequestException as e:
-            self.error.emit(f'网络请求失败: {str(e)}')
-        except json.JSONDecodeError:
-            self.error.emit('服务器响应格式错误')
-        except Exception as e:
-            self.error.emit(f'未知错误: {str(e)}')
-
-
-class LoginWindow(QWidget):
+
+class LoginWindow(InfoBarMixin, QWidget):
     """一个漂亮的 Fluent Design 风格登录窗口"""
 
+    # 提示信息文本，只创建一次
+    _ERR_TITLE = '登录失败'
+    _SUCCESS_TITLE = '登录成功'
+    _EMPTY_MSG = "用户名和密码不能为空！"
+
     def __init__(self):
         super().__init__()
+        # 复用全局线程池，避免每次请求都创建新线程
+        self.pool = QThreadPool.globalInstance()
         self.initUi()
 
     def initUi(self):
+        # 构建期间暂停重绘，布局调整合并为一次刷新
+        self.setUpdatesEnabled(False)
+
         # --- 窗口基本设置 ---
         self.setWindowTitle("Fluent Design 登录")
         # 登录窗口通常大小是固定的
@@ -129,6 +96,9 @@ class LoginWindow(QWidget):
         # --- 信号与槽连接 ---
         self.loginButton.clicked.connect(self.onLogin)
 
+        self.setUpdatesEnabled(True)
+
+    @throttled(timeout=500)
     def onLogin(self):
         """处理登录按钮点击事件"""
         username = self.usernameLineEdit.text().strip()
@@ -137,46 +107,35 @@ class LoginWindow(QWidget):
         # 简单的验证逻辑
         if not username or not password:
             # 使用 InfoBar 显示错误信息，比 QMessageBox 更优雅
-            InfoBar.error(
-                title='登录失败',
-                content="用户名和密码不能为空！",
-                duration=2000,
-                parent=self,
-                position=InfoBarPosition.TOP
-            )
+            self._show_info('error', self._ERR_TITLE, self._EMPTY_MSG, 2000)
             return
 
         # 禁用登录按钮，显示加载状态
         self.loginButton.setEnabled(False)
         self.loginButton.setText("登录中...")
         
-        # 创建网络请求线程
-        self.worker = NetworkWorker(
+        # 提交网络请求任务到线程池
+        task = NetworkTask(
             'https://pw.yangxz.top/login',
             {
                 'username': username,
                 'password': password
-            }
+            },
+            parse=LoginResult.from_response
         )
-        self.worker.finished.connect(self.on_login_success)
-        self.worker.error.connect(self.on_login_error)
-        self.worker.start()
+        task.signals.finished.connect(self.on_login_success)
+        task.signals.error.connect(self.on_login_error)
+        self.pool.start(task)
     
     def on_login_success(self, result):
         """登录成功回调"""
         self.loginButton.setEnabled(True)
         self.loginButton.setText("登 录")
         
-        # 显示成功信息
-        user_info = result.get('user', {})
-        display_name = user_info.get('display_name', '用户')
-        
-        InfoBar.success(
-            title='登录成功',
-            content=f"欢迎回来, {display_name}!",
-            duration=3000,
-            parent=self,
-            position=InfoBarPosition.TOP
+        # 显示成功信息（result 为工作线程中解析好的 LoginResult）
+        self._show_info(
+            'success', self._SUCCESS_TITLE,
+            f"欢迎回来, {result.display_name}!", 3000
         )
         
         # 在这里可以保存用户信息或跳转到主界面
@@ -189,13 +148,7 @@ class LoginWindow(QWidget):
         self.loginButton.setEnabled(True)
         self.loginButton.setText("登 录")
         
-        InfoBar.error(
-            title='登录失败',
-            content=f"登录失败: {error_msg}",
-            duration=3000,
-            parent=self,
-            position=InfoBarPosition.TOP
-        )
+        self._show_info('error', self._ERR_TITLE, f"登录失败: {error_msg}", 3000)
 
 
 if __name__ == '__main__':
@@ -207,6 +160,9 @@ if __name__ == '__main__':
 
     app = QApplication(sys.argv)
 
+    # 限制全局线程池的并发线程数（只在启动时设置一次）
+    QThreadPool.globalInstance().setMaxThreadCount(4)
+
     # --- 设置 Fluent 主题 (至关重要的一步！) ---
     # 你可以尝试 Theme.DARK, Theme.LIGHT, 或 Theme.AUTO
     setTheme(Theme.LIGHT)
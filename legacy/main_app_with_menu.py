@@ -5,27 +5,60 @@
 """
 
 import sys
-import subprocess
 import os
-from PyQt6.QtCore import Qt
+import io
+import importlib.util
+from PyQt6.QtCore import (
+    Qt, QUrl, QObject, QRunnable, QThreadPool, pyqtSignal
+)
 from PyQt6.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QMessageBox, QLabel
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QMessageBox, QLabel,
+    QDialog
 )
-from PyQt6.QtGui import QAction, QFont
+from PyQt6.QtGui import QAction, QDesktopServices
 
 # 导入 fluent-widgets 组件
-from qfluentwidgets import (
-    setTheme, Theme, TitleLabel, PrimaryPushButton, PushButton,
-    TextEdit as FluentTextEdit
-)
+from qfluentwidgets import setTheme, Theme, TextEdit as FluentTextEdit
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_view_users_main():
+    """加载 scripts/view_users.py 的入口函数"""
+    script_path = os.path.join(PROJECT_ROOT, "scripts", "view_users.py")
+    spec = importlib.util.spec_from_file_location("view_users", script_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.main
 
-# 导入现有的功能模块
-from src.ui.windows.login_window import LoginWindow
-from src.ui.windows.register_window import RegisterWindow
-from src.ui.windows.auth_window import UserAuthApp
-from src.ui.components.database_management import DatabaseManagementWidget
-from src.ui.components.settings import SettingsWidget
+
+class ScriptSignals(QObject):
+    """脚本任务信号"""
+    finished = pyqtSignal(str)
+    error = pyqtSignal(str)
+
+
+class ScriptTask(QRunnable):
+    """在线程池中运行脚本入口函数，并收集其输出
+
+    入口函数需接受 out 关键字参数，输出写入该流。
+    """
+
+    def __init__(self, func, *args):
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.signals = ScriptSignals()
+
+    def run(self):
+        # 每个任务使用独立的缓冲区，不重定向进程级的 sys.stdout
+        output = io.StringIO()
+        try:
+            self.func(*self.args, out=output)
+            self.signals.finished.emit(output.getvalue())
+        except (Exception, SystemExit) as e:
+            self.signals.error.emit(output.getvalue() or str(e))
 
 
 class MainAppWithMenu(QMainWindow):
@@ -55,10 +88,7 @@ class MainAppWithMenu(QMainWindow):
         
         title_label = QLabel("PyQt6 用户权限管理系统")
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_font = QFont()
-        title_font.setPointSize(24)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setStyleSheet("font-size: 24pt; font-weight: bold;")
         welcome_layout.addWidget(title_label)
         
         subtitle_label = QLabel("请使用菜单栏选择功能")
@@ -71,141 +101,133 @@ class MainAppWithMenu(QMainWindow):
         layout.addLayout(welcome_layout)
         layout.addStretch()
         
-        # 创建各个功能界面（隐藏状态）
-        self.login_interface = None
-        self.register_interface = None
-        self.db_management_widget = None
-        self.worker_test_widget = None
-        self.settings_widget = None
+        # 已打开过的窗口实例缓存，再次打开时直接复用
+        self.login_window = None
+        self.register_window = None
+        self.user_auth_app = None
+        self.worker_test_window = None
+        self.view_users_main = None
     
     def create_menu(self):
         """创建菜单栏"""
         menubar = self.menuBar()
         
-        # 用户管理菜单
-        user_menu = menubar.addMenu("用户管理")
-        
-        login_action = QAction("用户登录", self)
-        login_action.triggered.connect(self.open_login)
-        user_menu.addAction(login_action)
-        
-        register_action = QAction("用户注册", self)
-        register_action.triggered.connect(self.open_register)
-        user_menu.addAction(register_action)
-        
-        # 数据库管理菜单
-        db_menu = menubar.addMenu("数据库管理")
-        
-        view_remote_action = QAction("查看远程数据库", self)
-        view_remote_action.triggered.connect(self.view_remote_database)
-        db_menu.addAction(view_remote_action)
-        
-        view_local_action = QAction("查看本地数据库", self)
-        view_local_action.triggered.connect(self.view_local_database)
-        db_menu.addAction(view_local_action)
-        
-        db_menu.addSeparator()
-        
-        db_manage_action = QAction("数据库管理面板", self)
-        db_manage_action.triggered.connect(self.open_database_panel)
-        db_menu.addAction(db_manage_action)
-        
-        # 开发工具菜单
-        dev_menu = menubar.addMenu("开发工具")
-        
-        worker_test_action = QAction("Worker API 测试", self)
-        worker_test_action.triggered.connect(self.open_worker_test)
-        dev_menu.addAction(worker_test_action)
+        # 菜单定义表：(菜单标题, [(动作名称, 回调), ...])，None 表示分隔线
+        menu_spec = [
+            ("用户管理", [
+                ("用户登录", self.open_login),
+                ("用户注册", self.open_register),
+            ]),
+            ("数据库管理", [
+                ("查看远程数据库", self.view_remote_database),
+                ("查看本地数据库", self.view_local_database),
+                None,
+                ("数据库管理面板", self.open_database_panel),
+            ]),
+            ("开发工具", [
+                ("Worker API 测试", self.open_worker_test),
+                None,
+                ("打开脚本目录", self.open_scripts_directory),
+            ]),
+            ("设置", [
+                ("应用设置", self.open_settings),
+                None,
+                ("浅色主题", lambda: setTheme(Theme.LIGHT)),
+                ("深色主题", lambda: setTheme(Theme.DARK)),
+            ]),
+            ("帮助", [
+                ("关于", self.show_about),
+                ("查看文档", self.open_docs_directory),
+            ]),
+        ]
         
-        dev_menu.addSeparator()
-        
-        scripts_action = QAction("打开脚本目录", self)
-        scripts_action.triggered.connect(self.open_scripts_directory)
-        dev_menu.addAction(scripts_action)
-        
-        # 设置菜单
-        settings_menu = menubar.addMenu("设置")
-        
-        app_settings_action = QAction("应用设置", self)
-        app_settings_action.triggered.connect(self.open_settings)
-        settings_menu.addAction(app_settings_action)
-        
-        settings_menu.addSeparator()
-        
-        light_theme_action = QAction("浅色主题", self)
-        light_theme_action.triggered.connect(lambda: setTheme(Theme.LIGHT))
-        settings_menu.addAction(light_theme_action)
-        
-        dark_theme_action = QAction("深色主题", self)
-        dark_theme_action.triggered.connect(lambda: setTheme(Theme.DARK))
-        settings_menu.addAction(dark_theme_action)
-        
-        # 帮助菜单
-        help_menu = menubar.addMenu("帮助")
-        
-        about_action = QAction("关于", self)
-        about_action.triggered.connect(self.show_about)
-        help_menu.addAction(about_action)
-        
-        docs_action = QAction("查看文档", self)
-        docs_action.triggered.connect(self.open_docs_directory)
-        help_menu.addAction(docs_action)
+        for title, items in menu_spec:
+            menu = menubar.addMenu(title)
+            for item in items:
+                if item is None:
+                    menu.addSeparator()
+                    continue
+                label, callback = item
+                # 通过 triggered 关键字参数在构造时直接连接信号
+                menu.addAction(QAction(label, self, triggered=callback))
     
     def open_login(self):
         """打开登录窗口"""
         try:
-            self.login_window = LoginWindow()
-            self.login_window.show()
+            if self.login_window is None:
+                from src.ui.windows.login_window import LoginWindow
+                self.login_window = LoginWindow()
+            self._show_window(self.login_window)
         except Exception as e:
             QMessageBox.warning(self, "错误", f"无法打开登录窗口: {str(e)}")
     
     def open_register(self):
         """打开注册窗口"""
         try:
-            self.register_window = RegisterWindow()
-            self.register_window.show()
+            if self.register_window is None:
+                from src.ui.windows.register_window import RegisterWindow
+                self.register_window = RegisterWindow()
+            self._show_window(self.register_window)
         except Exception as e:
             QMessageBox.warning(self, "错误", f"无法打开注册窗口: {str(e)}")
     
     def view_remote_database(self):
         """查看远程数据库"""
-        try:
-            subprocess.run(
-                ["python", "scripts/view_users.py"], 
-                cwd=os.path.dirname(__file__)
-            )
-        except Exception as e:
-            QMessageBox.warning(
-                self, "错误", f"无法查看远程数据库: {str(e)}"
-            )
+        self.run_view_users("remote", "远程数据库")
     
     def view_local_database(self):
         """查看本地数据库"""
+        self.run_view_users("local", "本地数据库")
+
+    def run_view_users(self, database_type, title):
+        """在线程池中运行用户查看脚本，避免启动新的 Python 解释器"""
         try:
-            subprocess.run(
-                ["python", "scripts/view_users.py", "local"], 
-                cwd=os.path.dirname(__file__)
+            if self.view_users_main is None:
+                self.view_users_main = load_view_users_main()
+            task = ScriptTask(self.view_users_main, database_type)
+            task.signals.finished.connect(
+                lambda output: self.show_output(title, output)
             )
+            task.signals.error.connect(
+                lambda error: QMessageBox.warning(
+                    self, "错误", f"无法查看{title}: {error}"
+                )
+            )
+            QThreadPool.globalInstance().start(task)
         except Exception as e:
             QMessageBox.warning(
-                self, "错误", f"无法查看本地数据库: {str(e)}"
+                self, "错误", f"无法查看{title}: {str(e)}"
             )
     
+    def show_output(self, title, output):
+        """在只读文本框对话框中显示脚本输出"""
+        dialog = QDialog(self)
+        dialog.setWindowTitle(title)
+        dialog.resize(700, 500)
+        text_edit = FluentTextEdit(dialog)
+        text_edit.setReadOnly(True)
+        text_edit.setPlainText(output)
+        layout = QVBoxLayout(dialog)
+        layout.addWidget(text_edit)
+        dialog.show()
+
     def open_database_panel(self):
         """打开数据库管理面板"""
         try:
-            self.user_auth_app = UserAuthApp()
-            self.user_auth_app.show()
+            if self.user_auth_app is None:
+                from src.ui.windows.auth_window import AuthWindow as UserAuthApp
+                self.user_auth_app = UserAuthApp()
+            self._show_window(self.user_auth_app)
         except Exception as e:
             QMessageBox.warning(self, "错误", f"无法打开数据库管理面板: {str(e)}")
     
     def open_worker_test(self):
         """打开 Worker API 测试工具"""
         try:
-            subprocess.run(
-                ["python", "worker_test_app.py"], 
-                cwd=os.path.dirname(__file__)
-            )
+            if self.worker_test_window is None:
+                from worker_test_app import WorkerTestWindow
+                self.worker_test_window = WorkerTestWindow()
+            self._show_window(self.worker_test_window)
         except Exception as e:
             QMessageBox.warning(
                 self, "错误", f"无法打开测试工具: {str(e)}"
@@ -215,6 +237,12 @@ class MainAppWithMenu(QMainWindow):
         """打开设置面板"""
         QMessageBox.information(self, "设置", "设置功能正在开发中...")
     
+    def _show_window(self, window):
+        """显示窗口并将其置于前台"""
+        window.show()
+        window.raise_()
+        window.activateWindow()
+
     def set_theme(self, theme):
         """设置主题"""
         setTheme(theme)
@@ -230,23 +258,13 @@ class MainAppWithMenu(QMainWindow):
     
     def open_scripts_directory(self):
         """打开脚本目录"""
-        scripts_path = os.path.join(os.path.dirname(__file__), "scripts")
-        if sys.platform == "darwin":  # macOS
-            subprocess.run(["open", scripts_path])
-        elif sys.platform == "win32":  # Windows
-            subprocess.run(["explorer", scripts_path])
-        else:  # Linux
-            subprocess.run(["xdg-open", scripts_path])
+        scripts_path = os.path.join(PROJECT_ROOT, "scripts")
+        QDesktopServices.openUrl(QUrl.fromLocalFile(scripts_path))
     
     def open_docs_directory(self):
         """打开文档目录"""
-        docs_path = os.path.join(os.path.dirname(__file__), "docs")
-        if sys.platform == "darwin":  # macOS
-            subprocess.run(["open", docs_path])
-        elif sys.platform == "win32":  # Windows
-            subprocess.run(["explorer", docs_path])
-        else:  # Linux
-            subprocess.run(["xdg-open", docs_path])
+        docs_path = os.path.join(PROJECT_ROOT, "docs")
+        QDesktopServices.openUrl(QUrl.fromLocalFile(docs_path))
     
     def show_about(self):
         """显示关于对话框"""
@@ -276,6 +294,19 @@ def main():
         Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
     )
     
+    # 关闭用不到的 Qt 特性，减少启动开销
+    QApplication.setAttribute(
+        Qt.ApplicationAttribute.AA_DontCreateNativeWidgetSiblings, True
+    )
+    QApplication.setAttribute(
+        Qt.ApplicationAttribute.AA_CompressHighFrequencyEvents, True
+    )
+    # 无显示环境（CI / offscreen）下使用软件 OpenGL，避免初始化 GLX
+    if os.environ.get("CI") or os.environ.get("QT_QPA_PLATFORM") == "offscreen":
+        QApplication.setAttribute(
+            Qt.ApplicationAttribute.AA_UseSoftwareOpenGL, True
+        )
+
     app = QApplication(sys.argv)
     
     # 设置应用程序信息
@@ -1,69 +1,45 @@
 # register_app.py
 
+import re
 import sys
-import json
-import requests
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QThreadPool
 from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout
 
 # 导入 fluent-widgets 的核心组件
 from qfluentwidgets import (
-    setTheme, Theme, TitleLabel, LineEdit, PasswordLineEdit,
-    PrimaryPushButton, InfoBar, InfoBarPosition
+    setTheme, Theme, TitleLabel, LineEdit, PasswordLineEdit, PrimaryPushButton
 )
 
+from _netutils import NetworkTask, throttled
+from _uiutils import InfoBarMixin
 
-class NetworkWorker(QThread):
-    """网络请求工作线程"""
-    finished = pyqtSignal(dict)
-    error = pyqtSignal(str)
-    
-    def __init__(self, url, data, request_type='POST'):
-        super().__init__()
-        self.url = url
-        self.data = data
-        self.request_type = request_type
-    
-    def run(self):
-        try:
-            headers = {'Content-Type': 'application/json'}
-            
-            if self.request_type == 'POST':
-                response = requests.post(
-                    self.url, 
-                    data=json.dumps(self.data), 
-                    headers=headers,
-                    timeout=10
-                )
-            else:
-                response = requests.get(self.url, headers=headers, timeout=10)
-            
-            if response.status_code == 200:
-                result = response.json()
-                self.finished.emit(result)
-            else:
-                error_data = response.json() if response.content else {}
-                error_msg = error_data.get(
-                    'error', f'HTTP {response.status_code}'
-                )
-                self.error.emit(error_msg)
-                
-        except requests.exceptions.RequestException as e:
-            self.error.emit(f'网络请求失败: {str(e)}')
-        except json.JSONDecodeError:
-            self.error.emit('服务器响应格式错误')
-        except Exception as e:
-            self.error.emit(f'未知错误: {str(e)}')
-
-
-class RegisterWindow(QWidget):
+
+# 邮箱格式校验，模块导入时编译一次
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+class RegisterWindow(InfoBarMixin, QWidget):
     """用户注册窗口"""
 
+    # 提示信息文本，只创建一次
+    _ERR_TITLE = '注册失败'
+    _SUCCESS_TITLE = '注册成功'
+    _MISSING_MSG = "请填写必要的注册信息！"
+    _EMAIL_FORMAT_MSG = "邮箱格式错误！"
+    _SHORT_PASSWORD_MSG = "密码长度至少需要6个字符！"
+    _MISMATCH_MSG = "两次输入的密码不一致！"
+    _SUCCESS_MSG = "账户创建成功！请使用新账户登录。"
+
     def __init__(self):
         super().__init__()
+        # 复用全局线程池，避免每次请求都创建新线程
+        self.pool = QThreadPool.globalInstance()
         self.initUi()
 
     def initUi(self):
+        # 构建期间暂停重绘，布局调整合并为一次刷新
+        self.setUpdatesEnabled(False)
+
         # --- 窗口基本设置 ---
         self.setWindowTitle("用户注册")
         self.setFixedSize(400, 600)
@@ -130,51 +106,46 @@ class RegisterWindow(QWidget):
         # --- 信号与槽连接 ---
         self.registerButton.clicked.connect(self.onRegister)
 
+        self.setUpdatesEnabled(True)
+
+    @throttled(timeout=500)
     def onRegister(self):
         """处理注册按钮点击事件"""
+        # 每个输入框只读取一次；校验通过后才读取后面用到的字段
         username = self.usernameLineEdit.text().strip()
         email = self.emailLineEdit.text().strip()
-        display_name = self.displayNameLineEdit.text().strip()
         password = self.passwordLineEdit.text()
-        confirm_password = self.confirmPasswordLineEdit.text()
 
         # 验证输入
-        if not username or not email or not password:
-            InfoBar.error(
-                title='注册失败',
-                content="请填写必要的注册信息！",
-                duration=2000,
-                parent=self,
-                position=InfoBarPosition.TOP
+        if not all((username, email, password)):
+            self._show_info('error', self._ERR_TITLE, self._MISSING_MSG, 2000)
+            return
+
+        # 本地先校验邮箱格式，避免为格式错误白跑一次网络请求
+        if not _EMAIL_RE.match(email):
+            self._show_info(
+                'error', self._ERR_TITLE, self._EMAIL_FORMAT_MSG, 2000
             )
             return
         
         if len(password) < 6:
-            InfoBar.error(
-                title='注册失败',
-                content="密码长度至少需要6个字符！",
-                duration=2000,
-                parent=self,
-                position=InfoBarPosition.TOP
+            self._show_info(
+                'error', self._ERR_TITLE, self._SHORT_PASSWORD_MSG, 2000
             )
             return
         
-        if password != confirm_password:
-            InfoBar.error(
-                title='注册失败',
-                content="两次输入的密码不一致！",
-                duration=2000,
-                parent=self,
-                position=InfoBarPosition.TOP
-            )
+        if password != self.confirmPasswordLineEdit.text():
+            self._show_info('error', self._ERR_TITLE, self._MISMATCH_MSG, 2000)
             return
 
+        display_name = self.displayNameLineEdit.text().strip()
+
         # 禁用注册按钮，显示加载状态
         self.registerButton.setEnabled(False)
         self.registerButton.setText("注册中...")
         
-        # 创建网络请求线程
-        self.worker = NetworkWorker(
+        # 提交网络请求任务到线程池
+        task = NetworkTask(
             'https://pw.yangxz.top/register',
             {
                 'username': username,
@@ -183,21 +154,17 @@ class RegisterWindow(QWidget):
                 'display_name': display_name or username
             }
         )
-        self.worker.finished.connect(self.on_register_success)
-        self.worker.error.connect(self.on_register_error)
-        self.worker.start()
+        task.signals.finished.connect(self.on_register_success)
+        task.signals.error.connect(self.on_register_error)
+        self.pool.start(task)
     
     def on_register_success(self, result):
         """注册成功回调"""
         self.registerButton.setEnabled(True)
         self.registerButton.setText("注 册")
         
-        InfoBar.success(
-            title='注册成功',
-            content="账户创建成功！请使用新账户登录。",
-            duration=3000,
-            parent=self,
-            position=InfoBarPosition.TOP
+        self._show_info(
+            'success', self._SUCCESS_TITLE, self._SUCCESS_MSG, 3000
         )
         
         # 清空表单
@@ -212,13 +179,7 @@ class RegisterWindow(QWidget):
         self.registerButton.setEnabled(True)
         self.registerButton.setText("注 册")
         
-        InfoBar.error(
-            title='注册失败',
-            content=f"注册失败: {error_msg}",
-            duration=3000,
-            parent=self,
-            position=InfoBarPosition.TOP
-        )
+        self._show_info('error', self._ERR_TITLE, f"注册失败: {error_msg}", 3000)
 
 
 if __name__ == '__main__':
@@ -228,6 +189,9 @@ if __name__ == '__main__':
 
     app = QApplication(sys.argv)
 
+    # 限制全局线程池的并发线程数（只在启动时设置一次）
+    QThreadPool.globalInstance().setMaxThreadCount(4)
+
     # 设置 Fluent 主题
     setTheme(Theme.LIGHT)
 
@@ -1,77 +1,44 @@
 # user_auth_app.py
 
 import sys
-import json
-import requests
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QThreadPool
 from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout, QStackedWidget
 
 # 导入 fluent-widgets 的核心组件
 from qfluentwidgets import (
-    setTheme, Theme, TitleLabel, LineEdit, PasswordLineEdit,
-    PrimaryPushButton, InfoBar, InfoBarPosition, Pivot
+    setTheme, Theme, TitleLabel, LineEdit, PasswordLineEdit, PrimaryPushButton,
+    Pivot
 )
 
+from _netutils import LoginResult, NetworkTask, throttled
+from _uiutils import InfoBarMixin
 
-class NetworkWorker(QThread):
-    """网络请求工作线程"""
-    finished = pyqtSignal(dict)
-    error = pyqtSignal(str)
-    
-    def __init__(self, url, data, request_type='POST'):
-        super().__init__()
-        self.url = url
-        self.data = data
-        self.request_type = request_type
-    
-    def run(self):
-        try:
-            headers = {'Content-Type': 'application/json'}
-            
-            if self.request_type == 'POST':
-                response = requests.post(
-                    self.url, 
-                    data=json.dumps(self.data), 
-                    headers=headers,
-                    timeout=10
-                )
-            else:
-                response = requests.get(self.url, headers=headers, timeout=10)
-            
-            if response.status_code == 200:
-                result = response.json()
-                self.finished.emit(result)
-            else:
-                error_data = response.json() if response.content else {}
-                error_msg = error_data.get(
-                    'error', f'HTTP {response.status_code}'
-                )
-                self.error.emit(error_msg)
-                
-        except requests.exceptions.RequestException as e:
-            self.error.emit(f'网络请求失败: {str(e)}')
-        except json.JSONDecodeError:
-            self.error.emit('服务器响应格式错误')
-        except Exception as e:
-            self.error.emit(f'未知错误: {str(e)}')
 
-
-class LoginInterface(QWidget):
+class LoginInterface(InfoBarMixin, QWidget):
     """登录界面"""
     
+    # 提示信息文本，只创建一次
+    _ERR_TITLE = '登录失败'
+    _SUCCESS_TITLE = '登录成功'
+    _EMPTY_MSG = "用户名和密码不能为空！"
+
     def __init__(self):
         super().__init__()
+        # 复用全局线程池，避免每次请求都创建新线程
+        self.pool = QThreadPool.globalInstance()
         self.init_ui()
     
     def init_ui(self):
         layout = QVBoxLayout(self)
+        # 统一控件间距，只在标题后和按钮前额外留白
+        layout.setSpacing(15)
         
         # 标题
         title = TitleLabel("用户登录")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
         
-        layout.addSpacing(30)
+        layout.addSpacing(15)
         
         # 用户名输入
         self.username_input = LineEdit()
@@ -79,15 +46,13 @@ class LoginInterface(QWidget):
         self.username_input.setMinimumHeight(40)
         layout.addWidget(self.username_input)
         
-        layout.addSpacing(15)
-        
         # 密码输入
         self.password_input = PasswordLineEdit()
         self.password_input.setPlaceholderText("请输入密码")
         self.password_input.setMinimumHeight(40)
         layout.addWidget(self.password_input)
         
-        layout.addSpacing(30)
+        layout.addSpacing(15)
         
         # 登录按钮
         self.login_btn = PrimaryPushButton("登 录")
@@ -98,80 +63,78 @@ class LoginInterface(QWidget):
         # 设置布局边距
         layout.setContentsMargins(40, 30, 40, 30)
     
+    @throttled(timeout=500)
     def handle_login(self):
         username = self.username_input.text().strip()
         password = self.password_input.text()
         
         if not username or not password:
-            InfoBar.error(
-                title='登录失败',
-                content="用户名和密码不能为空！",
-                duration=2000,
-                parent=self,
-                position=InfoBarPosition.TOP
-            )
+            self._show_info('error', self._ERR_TITLE, self._EMPTY_MSG, 2000)
             return
         
         # 禁用登录按钮
         self.login_btn.setEnabled(False)
         self.login_btn.setText("登录中...")
         
-        # 创建网络请求线程
-        self.worker = NetworkWorker(
+        # 提交网络请求任务到线程池
+        task = NetworkTask(
             'https://pw.yangxz.top/login',
             {
                 'username': username,
                 'password': password
-            }
+            },
+            parse=LoginResult.from_response
         )
-        self.worker.finished.connect(self.on_login_success)
-        self.worker.error.connect(self.on_login_error)
-        self.worker.start()
+        task.signals.finished.connect(self.on_login_success)
+        task.signals.error.connect(self.on_login_error)
+        self.pool.start(task)
     
     def on_login_success(self, result):
         self.login_btn.setEnabled(True)
         self.login_btn.setText("登 录")
         
-        user_info = result.get('user', {})
-        display_name = user_info.get('display_name', '用户')
-        
-        InfoBar.success(
-            title='登录成功',
-            content=f"欢迎回来, {display_name}!",
-            duration=3000,
-            parent=self,
-            position=InfoBarPosition.TOP
+        self._show_info(
+            'success', self._SUCCESS_TITLE,
+            f"欢迎回来, {result.display_name}!", 3000
         )
     
     def on_login_error(self, error_msg):
         self.login_btn.setEnabled(True)
         self.login_btn.setText("登 录")
         
-        InfoBar.error(
-            title='登录失败',
-            content=f"登录失败: {error_msg}",
-            duration=3000,
-            parent=self,
-            position=InfoBarPosition.TOP
+        self._show_info(
+            'error', self._ERR_TITLE, f"登录失败: {error_msg}", 3000
         )
 
 
-class RegisterInterface(QWidget):
+class RegisterInterface(InfoBarMixin, QWidget):
     """注册界面"""
     
+    # 提示信息文本，只创建一次
+    _ERR_TITLE = '注册失败'
+    _SUCCESS_TITLE = '注册成功'
+    _MISSING_MSG = "请填写必要的注册信息！"
+    _SHORT_PASSWORD_MSG = "密码长度至少需要6个字符！"
+    _MISMATCH_MSG = "两次输入的密码不一致！"
+    _SUCCESS_MSG = "账户创建成功！请切换到登录页面使用新账户登录。"
+
     def __init__(self):
         super().__init__()
+        # 复用全局线程池，避免每次请求都创建新线程
+        self.pool = QThreadPool.globalInstance()
         self.init_ui()
     
     def init_ui(self):
         layout = QVBoxLayout(self)
+        # 统一控件间距，只在标题后和按钮前额外留白
+        layout.setSpacing(15)
         
         # 标题
         title = TitleLabel("用户注册")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
         
-        layout.addSpacing(30)
+        layout.addSpacing(15)
         
         # 用户名输入
         self.username_input = LineEdit()
@@ -179,39 +142,31 @@ class RegisterInterface(QWidget):
         self.username_input.setMinimumHeight(40)
         layout.addWidget(self.username_input)
         
-        layout.addSpacing(15)
-        
         # 邮箱输入
         self.email_input = LineEdit()
         self.email_input.setPlaceholderText("请输入邮箱地址")
         self.email_input.setMinimumHeight(40)
         layout.addWidget(self.email_input)
         
-        layout.addSpacing(15)
-        
         # 显示名称输入
         self.display_name_input = LineEdit()
         self.display_name_input.setPlaceholderText("请输入显示名称（可选）")
         self.display_name_input.setMinimumHeight(40)
         layout.addWidget(self.display_name_input)
         
-        layout.addSpacing(15)
-        
         # 密码输入
         self.password_input = PasswordLineEdit()
         self.password_input.setPlaceholderText("请输入密码（至少6个字符）")
         self.password_input.setMinimumHeight(40)
         layout.addWidget(self.password_input)
         
-        layout.addSpacing(15)
-        
         # 确认密码输入
         self.confirm_password_input = PasswordLineEdit()
         self.confirm_password_input.setPlaceholderText("请再次输入密码")
         self.confirm_password_input.setMinimumHeight(40)
         layout.addWidget(self.confirm_password_input)
         
-        layout.addSpacing(30)
+        layout.addSpacing(15)
         
         # 注册按钮
         self.register_btn = PrimaryPushButton("注 册")
@@ -222,50 +177,36 @@ class RegisterInterface(QWidget):
         # 设置布局边距
         layout.setContentsMargins(40, 30, 40, 30)
     
+    @throttled(timeout=500)
     def handle_register(self):
+        # 每个输入框只读取一次；校验通过后才读取后面用到的字段
         username = self.username_input.text().strip()
         email = self.email_input.text().strip()
-        display_name = self.display_name_input.text().strip()
         password = self.password_input.text()
-        confirm_password = self.confirm_password_input.text()
         
         # 验证输入
-        if not username or not email or not password:
-            InfoBar.error(
-                title='注册失败',
-                content="请填写必要的注册信息！",
-                duration=2000,
-                parent=self,
-                position=InfoBarPosition.TOP
-            )
+        if not all((username, email, password)):
+            self._show_info('error', self._ERR_TITLE, self._MISSING_MSG, 2000)
             return
         
         if len(password) < 6:
-            InfoBar.error(
-                title='注册失败',
-                content="密码长度至少需要6个字符！",
-                duration=2000,
-                parent=self,
-                position=InfoBarPosition.TOP
+            self._show_info(
+                'error', self._ERR_TITLE, self._SHORT_PASSWORD_MSG, 2000
             )
             return
         
-        if password != confirm_password:
-            InfoBar.error(
-                title='注册失败',
-                content="两次输入的密码不一致！",
-                duration=2000,
-                parent=self,
-                position=InfoBarPosition.TOP
-            )
+        if password != self.confirm_password_input.text():
+            self._show_info('error', self._ERR_TITLE, self._MISMATCH_MSG, 2000)
             return
+
+        display_name = self.display_name_input.text().strip()
         
         # 禁用注册按钮
         self.register_btn.setEnabled(False)
         self.register_btn.setText("注册中...")
         
-        # 创建网络请求线程
-        self.worker = NetworkWorker(
+        # 提交网络请求任务到线程池
+        task = NetworkTask(
             'https://pw.yangxz.top/register',
             {
                 'username': username,
@@ -274,20 +215,16 @@ class RegisterInterface(QWidget):
                 'display_name': display_name or username
             }
         )
-        self.worker.finished.connect(self.on_register_success)
-        self.worker.error.connect(self.on_register_error)
-        self.worker.start()
+        task.signals.finished.connect(self.on_register_success)
+        task.signals.error.connect(self.on_register_error)
+        self.pool.start(task)
     
     def on_register_success(self, result):
         self.register_btn.setEnabled(True)
         self.register_btn.setText("注 册")
         
-        InfoBar.success(
-            title='注册成功',
-            content="账户创建成功！请切换到登录页面使用新账户登录。",
-            duration=3000,
-            parent=self,
-            position=InfoBarPosition.TOP
+        self._show_info(
+            'success', self._SUCCESS_TITLE, self._SUCCESS_MSG, 3000
         )
         
         # 清空表单
@@ -301,18 +238,17 @@ class RegisterInterface(QWidget):
         self.register_btn.setEnabled(True)
         self.register_btn.setText("注 册")
         
-        InfoBar.error(
-            title='注册失败',
-            content=f"注册失败: {error_msg}",
-            duration=3000,
-            parent=self,
-            position=InfoBarPosition.TOP
+        self._show_info(
+            'error', self._ERR_TITLE, f"注册失败: {error_msg}", 3000
         )
 
 
 class UserAuthApp(QWidget):
     """用户认证主应用"""
     
+    # Pivot 路由键与堆叠页面索引的对应关系
+    _ROUTE_INDEX = {'login': 0, 'register': 1}
+
     def __init__(self):
         super().__init__()
         self.init_ui()
@@ -323,22 +259,11 @@ class UserAuthApp(QWidget):
         
         layout = QVBoxLayout(self)
         
-        # 创建 Pivot 导航
+        # 创建 Pivot 导航，切换由 currentItemChanged 统一处理
         self.pivot = Pivot(self)
-        self.pivot.addItem(
-            routeKey='login',
-            text='登录',
-            onClick=lambda: self.stackedWidget.setCurrentWidget(
-                self.login_interface
-            )
-        )
-        self.pivot.addItem(
-            routeKey='register', 
-            text='注册',
-            onClick=lambda: self.stackedWidget.setCurrentWidget(
-                self.register_interface
-            )
-        )
+        self.pivot.addItem(routeKey='login', text='登录')
+        self.pivot.addItem(routeKey='register', text='注册')
+        self.pivot.currentItemChanged.connect(self._on_route_changed)
         
         layout.addWidget(self.pivot)
         
@@ -355,13 +280,18 @@ class UserAuthApp(QWidget):
         
         layout.addWidget(self.stackedWidget)
         
-        # 设置默认显示登录界面
-        self.stackedWidget.setCurrentWidget(self.login_interface)
+        # 默认显示登录界面（第一个加入的页面已是当前页，只需同步 Pivot）
         self.pivot.setCurrentItem('login')
         
         # 设置布局边距
         layout.setContentsMargins(20, 20, 20, 20)
 
+    def _on_route_changed(self, route_key):
+        """根据 Pivot 路由键切换堆叠页面，已在目标页时不做任何事"""
+        index = self._ROUTE_INDEX[route_key]
+        if self.stackedWidget.currentIndex() != index:
+            self.stackedWidget.setCurrentIndex(index)
+
 
 if __name__ == '__main__':
     # 启用高分屏支持
@@ -370,6 +300,9 @@ if __name__ == '__main__':
 
     app = QApplication(sys.argv)
 
+    # 限制全局线程池的并发线程数（只在启动时设置一次）
+    QThreadPool.globalInstance().setMaxThreadCount(4)
+
     # 设置 Fluent 主题
     setTheme(Theme.LIGHT)
 
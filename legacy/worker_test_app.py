@@ -2,66 +2,104 @@
 
 import sys
 import json
-import requests
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+import time
+from PyQt6.QtCore import (
+    Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+)
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout
 )
 
 # 导入 fluent-widgets 的核心组件
 from qfluentwidgets import (
-    setTheme, Theme, TitleLabel, PrimaryPushButton, PushButton,
-    InfoBar, InfoBarPosition, LineEdit, TextEdit
+    setTheme, Theme, TitleLabel, PrimaryPushButton, PushButton, LineEdit,
+    TextEdit
 )
 
+from _netutils import (
+    JSON_HEADERS, dumps_json, dumps_pretty, get_session, loads_json
+)
+from _uiutils import InfoBarMixin
 
-class WorkerRequestThread(QThread):
-    """处理网络请求的线程，避免阻塞UI"""
-    
-    # 定义信号
-    request_finished = pyqtSignal(dict)  # 请求成功
+
+class WorkerRequestSignals(QObject):
+    """请求任务的信号（QRunnable 不是 QObject，不能直接定义信号）"""
+    request_finished = pyqtSignal(str)   # 请求成功，附带格式化后的 JSON 文本
     request_error = pyqtSignal(str)      # 请求失败
+    done = pyqtSignal()                  # 请求结束（无论成功与否）
+
+
+class WorkerRequestTask(QRunnable):
+    """处理网络请求的任务，由线程池执行，避免阻塞UI"""
     
-    def __init__(self, url, method='GET', data=None):
+    def __init__(self, url, method='GET', data=None, signals=None):
         super().__init__()
         self.url = url
         self.method = method
         self.data = data
+        # 可传入窗口持有的信号对象，复用其上已建立的连接
+        self.signals = signals or WorkerRequestSignals()
     
     def run(self):
         """在后台线程中执行网络请求"""
+        from requests.exceptions import RequestException
+
+        session = get_session()
         try:
             if self.method == 'GET':
-                response = requests.get(self.url, timeout=10)
+                response = session.get(self.url, timeout=10)
             elif self.method == 'POST':
-                headers = {'Content-Type': 'application/json'}
-                response = requests.post(
+                # 已是序列化好的 JSON bytes 时直接发送，不再重复编码
+                body = self.data
+                if not isinstance(body, (bytes, bytearray)):
+                    body = dumps_json(body)
+                response = session.post(
                     self.url, 
-                    json=self.data, 
-                    headers=headers, 
+                    data=body,
+                    headers=JSON_HEADERS,
                     timeout=10
                 )
             
             response.raise_for_status()  # 检查HTTP错误
-            result = response.json()
-            self.request_finished.emit(result)
+            result = loads_json(response.content)
+            # 在工作线程中完成格式化，界面线程只负责显示
+            self.signals.request_finished.emit(dumps_pretty(result))
             
-        except requests.exceptions.RequestException as e:
-            self.request_error.emit(f"网络请求错误: {str(e)}")
         except json.JSONDecodeError as e:
-            self.request_error.emit(f"JSON解析错误: {str(e)}")
+            self.signals.request_error.emit(f"JSON解析错误: {str(e)}")
+        except RequestException as e:
+            self.signals.request_error.emit(f"网络请求错误: {str(e)}")
         except Exception as e:
-            self.request_error.emit(f"未知错误: {str(e)}")
+            self.signals.request_error.emit(f"未知错误: {str(e)}")
+        finally:
+            self.signals.done.emit()
 
 
-class WorkerTestWindow(QWidget):
+class WorkerTestWindow(InfoBarMixin, QWidget):
     """Python Worker测试界面"""
     
+    # 提示信息文本，只创建一次
+    _SUCCESS_TITLE = '请求成功'
+    _SUCCESS_MSG = "Worker响应已接收"
+    _ERR_TITLE = '请求失败'
+
+    # /status 响应的缓存有效期（秒）
+    _STATUS_TTL = 5.0
+
     def __init__(self):
         super().__init__()
         # 远程Worker地址
         self.worker_url = "https://pw.yangxz.top"
-        self.request_thread = None
+        # /status 响应缓存：url -> (缓存时间, 格式化后的响应文本)
+        self._status_cache = {}
+        # 复用全局线程池，每次点击不再创建新线程
+        self.pool = QThreadPool.globalInstance()
+        # 所有请求任务共用一个信号对象，只在这里连接一次
+        self._cache_url = None
+        self.request_signals = WorkerRequestSignals(self)
+        self.request_signals.request_finished.connect(self.on_request_success)
+        self.request_signals.request_error.connect(self.on_request_error)
+        self.request_signals.done.connect(self._on_request_done)
         self.initUi()
     
     def initUi(self):
@@ -109,39 +147,43 @@ class WorkerTestWindow(QWidget):
         self.clearButton = PushButton("清除结果")
         
         # --- 布局管理 ---
-        self.mainLayout.addSpacing(20)
+        # 统一控件间距，只在标题后额外留白
+        self.mainLayout.setSpacing(15)
         self.mainLayout.addWidget(
             self.titleLabel, 0, Qt.AlignmentFlag.AlignCenter
         )
-        self.mainLayout.addSpacing(30)
+        self.mainLayout.addSpacing(15)
         
         # URL输入
         self.mainLayout.addWidget(self.urlLineEdit)
-        self.mainLayout.addSpacing(20)
         
         # 测试按钮
         self.testButtonLayout.addWidget(self.testGetButton)
         self.testButtonLayout.addWidget(self.testStatusButton)
         self.testButtonLayout.addWidget(self.testPostButton)
         self.mainLayout.addLayout(self.testButtonLayout)
-        self.mainLayout.addSpacing(15)
         
         # POST数据输入
         self.mainLayout.addWidget(self.postDataEdit)
-        self.mainLayout.addSpacing(20)
         
         # 响应显示
         self.mainLayout.addWidget(self.responseLabel)
         self.mainLayout.addWidget(self.responseTextEdit)
-        self.mainLayout.addSpacing(15)
         
         # 清除按钮
         self.mainLayout.addWidget(self.clearButton)
         
         # 设置整体布局的边距
-        self.mainLayout.setContentsMargins(30, 0, 30, 30)
+        self.mainLayout.setContentsMargins(30, 20, 30, 30)
         
         # --- 信号与槽连接 ---
+        # 防抖：空闲时的首次点击立即发送，200 ms 内的连续点击只保留最后一次
+        self._pending = None
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(200)
+        self._debounce.timeout.connect(self._flush_pending)
+
         self.testGetButton.clicked.connect(self.test_get_endpoint)
         self.testStatusButton.clicked.connect(self.test_status_endpoint)
         self.testPostButton.clicked.connect(self.test_post_endpoint)
@@ -154,14 +196,21 @@ class WorkerTestWindow(QWidget):
         self.worker_url = (
             url_text or "https://pw.yangxz.top"
         )
+        # 地址变化后旧的缓存不再有效
+        self._status_cache.clear()
     
     def test_get_endpoint(self):
         """测试GET /test端点"""
-        self.make_request(f"{self.worker_url}/test", "GET")
+        self.request_debounced(f"{self.worker_url}/test", "GET")
     
     def test_status_endpoint(self):
-        """测试GET /status端点"""
-        self.make_request(f"{self.worker_url}/status", "GET")
+        """测试GET /status端点，有效期内直接使用缓存的响应"""
+        url = f"{self.worker_url}/status"
+        cached = self._status_cache.get(url)
+        if cached and time.monotonic() - cached[0] < self._STATUS_TTL:
+            self.on_request_success(cached[1])
+            return
+        self.request_debounced(url, "GET", cache=True)
     
     def test_post_endpoint(self):
         """测试POST /data端点"""
@@ -171,44 +220,60 @@ class WorkerTestWindow(QWidget):
                 self.show_error("请输入POST数据")
                 return
             
-            post_data = json.loads(post_data_text)
-            self.make_request(f"{self.worker_url}/data", "POST", post_data)
+            # 只做格式校验，校验通过后原样发送输入的字节
+            post_data = post_data_text.encode('utf-8')
+            loads_json(post_data)
+            self.request_debounced(
+                f"{self.worker_url}/data", "POST", post_data
+            )
             
         except json.JSONDecodeError as e:
             self.show_error(f"POST数据JSON格式错误: {str(e)}")
     
-    def make_request(self, url, method, data=None):
+    def request_debounced(self, url, method, data=None, cache=False):
+        """防抖后发起请求"""
+        if self._debounce.isActive():
+            # 处于防抖窗口内，只记录最新的一次请求
+            self._pending = (url, method, data, cache)
+        else:
+            self.make_request(url, method, data, cache)
+        self._debounce.start()
+
+    def _flush_pending(self):
+        """防抖窗口结束，发送窗口内最后一次点击的请求"""
+        if self._pending is not None:
+            pending = self._pending
+            self._pending = None
+            self.make_request(*pending)
+
+    def make_request(self, url, method, data=None, cache=False):
         """发起网络请求"""
-        # 如果有正在运行的请求，先停止它
-        if self.request_thread and self.request_thread.isRunning():
-            self.request_thread.quit()
-            self.request_thread.wait()
-        
-        # 禁用按钮，显示加载状态
+        # 禁用按钮，显示加载状态；请求结束前不会再发起新请求
         self.set_buttons_enabled(False)
         self.responseTextEdit.setPlainText(f"正在请求 {method} {url}...")
         
-        # 创建并启动请求线程
-        self.request_thread = WorkerRequestThread(url, method, data)
-        self.request_thread.request_finished.connect(self.on_request_success)
-        self.request_thread.request_error.connect(self.on_request_error)
-        self.request_thread.finished.connect(
-            lambda: self.set_buttons_enabled(True)
+        # 需要缓存响应时记下地址，由 on_request_success 写入缓存
+        self._cache_url = url if cache else None
+
+        # 提交请求任务到线程池
+        self.pool.start(
+            WorkerRequestTask(url, method, data, self.request_signals)
         )
-        self.request_thread.start()
     
-    def on_request_success(self, result):
+    def _on_request_done(self):
+        """请求结束（无论成功与否）后恢复按钮"""
+        self.set_buttons_enabled(True)
+
+    def on_request_success(self, formatted_json):
         """处理请求成功"""
-        formatted_json = json.dumps(result, indent=2, ensure_ascii=False)
+        if self._cache_url is not None:
+            self._status_cache[self._cache_url] = (
+                time.monotonic(), formatted_json
+            )
+            self._cache_url = None
         self.responseTextEdit.setPlainText(formatted_json)
         
-        InfoBar.success(
-            title='请求成功',
-            content="Worker响应已接收",
-            duration=2000,
-            parent=self,
-            position=InfoBarPosition.TOP
-        )
+        self._show_info('success', self._SUCCESS_TITLE, self._SUCCESS_MSG, 2000)
     
     def on_request_error(self, error_message):
         """处理请求错误"""
@@ -217,13 +282,7 @@ class WorkerTestWindow(QWidget):
     
     def show_error(self, message):
         """显示错误信息"""
-        InfoBar.error(
-            title='请求失败',
-            content=message,
-            duration=3000,
-            parent=self,
-            position=InfoBarPosition.TOP
-        )
+        self._show_info('error', self._ERR_TITLE, message, 3000)
     
     def clear_response(self):
         """清除响应结果"""
@@ -235,13 +294,6 @@ class WorkerTestWindow(QWidget):
         self.testStatusButton.setEnabled(enabled)
         self.testPostButton.setEnabled(enabled)
     
-    def closeEvent(self, event):
-        """窗口关闭时清理资源"""
-        if self.request_thread and self.request_thread.isRunning():
-            self.request_thread.quit()
-            self.request_thread.wait()
-        event.accept()
-
 
 if __name__ == '__main__':
     # 启用高分屏支持
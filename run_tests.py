@@ -15,20 +15,48 @@
 """
 
 import argparse
+import importlib.util
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 
 
+# 由命令行选项决定、追加到每条 pytest 命令末尾的参数（如 --lf、--ff）
+pytestExtraArgs = []
+
+# Qt 界面测试默认单进程运行
+UI_TEST_JOBS = 1
+
+
+def spawnArgs(command):
+    """子进程启动参数
+
+    传入可执行文件的绝对路径并保留 close_fds=False（Python 创建的文件描述符
+    默认不可继承），满足 subprocess 走 posix_spawn 的条件，避免按父进程
+    内存大小复制页表的 fork 开销。
+
+    Raises:
+        FileNotFoundError: 在 PATH 中找不到命令时抛出，与直接启动子进程时一致
+    """
+    executable = shutil.which(command[0])
+    if executable is None:
+        raise FileNotFoundError(command[0])
+    return {"args": [executable, *command[1:]], "close_fds": False}
+
+
 def runCommand(command, description):
     """执行命令并处理结果"""
+    if command[0] == "pytest" and pytestExtraArgs:
+        command = [*command, *pytestExtraArgs]
+
     print(f"\n{'=' * 60}")
     print(f"执行: {description}")
     print(f"命令: {' '.join(command)}")
     print(f"{'=' * 60}")
 
     try:
-        subprocess.run(command, check=True, capture_output=False)
+        subprocess.run(**spawnArgs(command), check=True, capture_output=False)
         print(f"\n✅ {description} - 成功完成")
         return True
     except subprocess.CalledProcessError as e:
@@ -40,34 +68,116 @@ def runCommand(command, description):
         return False
 
 
-def runAllTests():
+def runCommandsConcurrently(commands):
+    """同时启动多个互不依赖的命令，全部结束后依次汇报结果
+
+    Args:
+        commands: (命令列表, 描述) 元组的列表
+
+    Returns:
+        全部成功返回 True，否则返回 False
+    """
+    processes = []
+    for command, description in commands:
+        print(f"启动: {description} -> {' '.join(command)}")
+        try:
+            processes.append((subprocess.Popen(**spawnArgs(command)), description))
+        except FileNotFoundError:
+            print(f"\n❌ {description} - 找不到命令: {command[0]}")
+            processes.append((None, description))
+
+    success = True
+    for process, description in processes:
+        if process is None:
+            success = False
+            continue
+        returnCode = process.wait()
+        if returnCode == 0:
+            print(f"✅ {description} - 成功完成")
+        else:
+            print(f"❌ {description} - 执行失败 (退出码: {returnCode})")
+            success = False
+
+    return success
+
+
+def parallelArgs(jobs):
+    """pytest-xdist 并行参数
+
+    按文件分发测试，同一文件内的测试在同一个进程中运行，
+    以保证模块级 fixture 和 QApplication 实例的复用。
+    jobs 为 1 时使用 -n 0，直接在 pytest 主进程中运行，不启动工作进程。
+    """
+    if str(jobs) in ("0", "1"):
+        return ["-n", "0"]
+    return ["-n", str(jobs), "--dist=loadfile"]
+
+
+def runWithUiDefault(command, description, jobs=None):
+    """运行会收集到 tests/ui 的 pytest 命令
+
+    指定 jobs 时整体按该进程数运行；未指定时其余测试并行运行，
+    tests/ui 再单独运行一次，沿用UI测试的单进程默认值。
+    """
+    if jobs is not None:
+        return runCommand([*command, *parallelArgs(jobs)], description)
+
+    success = runCommand(
+        [*command, "--ignore=tests/ui", *parallelArgs("auto")], description
+    )
+    uiCommand = [*command, "tests/ui/", *parallelArgs(UI_TEST_JOBS)]
+    return runCommand(uiCommand, f"{description}（UI测试）") and success
+
+
+def runAllTests(jobs=None):
     """运行所有测试"""
     command = ["pytest", "-v", "--tb=short"]
-    return runCommand(command, "运行所有测试")
+    return runWithUiDefault(command, "运行所有测试", jobs)
 
 
-def runUnitTests():
+def runUnitTests(jobs="auto"):
     """运行单元测试"""
-    command = ["pytest", "-v", "-m", "unit", "tests/unit/"]
+    command = ["pytest", "-v", "-m", "unit", "tests/unit/", *parallelArgs(jobs)]
     return runCommand(command, "运行单元测试")
 
 
-def runIntegrationTests():
+def runIntegrationTests(jobs="auto"):
     """运行集成测试"""
-    command = ["pytest", "-v", "-m", "integration", "tests/integration/"]
+    command = [
+        "pytest", "-v", "-m", "integration", "tests/integration/",
+        *parallelArgs(jobs)
+    ]
     return runCommand(command, "运行集成测试")
 
 
-def runUiTests():
-    """运行UI测试"""
-    command = ["pytest", "-v", "-m", "ui", "tests/ui/"]
+def runUiTests(jobs=UI_TEST_JOBS):
+    """运行UI测试（Qt 界面测试默认单进程运行）"""
+    command = ["pytest", "-v", "-m", "ui", "tests/ui/", *parallelArgs(jobs)]
     return runCommand(command, "运行UI测试")
 
 
-def runFastTests():
+def runBatchTests(suites, jobs="auto"):
+    """在一次 pytest 调用中运行多个测试套件
+
+    相比逐个套件启动 pytest，只需付出一次解释器启动、插件加载和
+    PyQt6 导入的开销。
+
+    Args:
+        suites: 套件名称列表，取值为 'unit' / 'integration' / 'ui'
+        jobs: 并行进程数
+    """
+    command = [
+        "pytest", "-v", "-m", " or ".join(suites),
+        *[f"tests/{suite}/" for suite in suites],
+        *parallelArgs(jobs)
+    ]
+    return runCommand(command, f"批量运行测试: {', '.join(suites)}")
+
+
+def runFastTests(jobs=None):
     """运行快速测试（跳过慢速测试）"""
     command = ["pytest", "-v", "-m", "not slow", "--tb=short"]
-    return runCommand(command, "运行快速测试")
+    return runWithUiDefault(command, "运行快速测试", jobs)
 
 
 def runCoverageTests():
@@ -103,12 +213,11 @@ def runLinting():
         (["isort", "--check-only", "src/", "tests/"], "检查导入排序 (isort)")
     ]
 
-    success = True
-    for command, description in commands:
-        if not runCommand(command, description):
-            success = False
-
-    return success
+    # 三个检查互不依赖且只读文件，并发运行，总耗时取决于最慢的 pylint
+    print(f"\n{'=' * 60}")
+    print("执行: 代码质量检查")
+    print(f"{'=' * 60}")
+    return runCommandsConcurrently(commands)
 
 
 def runSpecificFile(filepath):
@@ -133,16 +242,17 @@ def checkEnvironment():
     requiredPackages = [
         ("pytest", "pytest"),
         ("pytest-qt", "pytestqt"),
+        ("pytest-xdist", "xdist"),
         ("PyQt6", "PyQt6"),
         ("qfluentwidgets", "qfluentwidgets")
     ]
 
     missingPackages = []
     for packageName, importName in requiredPackages:
-        try:
-            __import__(importName)
+        # 只查找模块规格，不实际导入（避免加载 Qt 动态库）
+        if importlib.util.find_spec(importName) is not None:
             print(f"✅ {packageName} - 已安装")
-        except ImportError:
+        else:
             print(f"❌ {packageName} - 未安装")
             missingPackages.append(packageName)
 
@@ -176,6 +286,10 @@ def main():
   python run_tests.py --integration            # 只运行集成测试
   python run_tests.py --ui                     # 只运行UI测试
   python run_tests.py --fast                   # 运行快速测试
+  python run_tests.py --unit --jobs 4          # 使用4个进程并行运行单元测试
+  python run_tests.py --unit --integration --batch  # 在同一个 pytest 进程中运行多个套件
+  python run_tests.py --unit --lf              # 只重跑上次失败的单元测试
+  python run_tests.py --all --no-cache         # CI 中运行，不读写 .pytest_cache
   python run_tests.py --coverage               # 运行测试并生成覆盖率报告
   python run_tests.py --lint                   # 运行代码质量检查
   python run_tests.py --file tests/unit/test_user_repository.py  # 运行特定文件
@@ -192,11 +306,38 @@ def main():
     parser.add_argument("--lint", action="store_true", help="运行代码质量检查")
     parser.add_argument("--file", type=str, help="运行特定测试文件")
     parser.add_argument("--check", action="store_true", help="检查测试环境")
+    parser.add_argument(
+        "--jobs", type=str, default=None,
+        help="并行进程数（默认 auto，UI 测试默认 1）"
+    )
+    parser.add_argument(
+        "--batch", action="store_true",
+        help="将选中的 --unit/--integration/--ui 合并为一次 pytest 调用"
+    )
+    parser.add_argument("--lf", action="store_true", help="只运行上次失败的测试")
+    parser.add_argument("--ff", action="store_true", help="先运行上次失败的测试，再运行其余测试")
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="禁用 pytest 缓存插件（适用于 CI 的全新环境）"
+    )
 
     args = parser.parse_args()
 
-    # 如果没有提供参数，显示帮助
-    if not any(vars(args).values()):
+    # --lf/--ff 依赖 .pytest_cache 中记录的失败用例，不能与 --no-cache 同时使用
+    if args.no_cache and (args.lf or args.ff):
+        parser.error("--no-cache 不能与 --lf/--ff 同时使用")
+
+    if args.lf:
+        pytestExtraArgs.append("--lf")
+    if args.ff:
+        pytestExtraArgs.append("--ff")
+    if args.no_cache:
+        pytestExtraArgs.extend(["-p", "no:cacheprovider"])
+
+    # 如果没有提供参数，显示帮助（以下选项只是修饰参数，不单独触发操作）
+    modifiers = {"jobs", "batch", "lf", "ff", "no_cache"}
+    actions = {key: value for key, value in vars(args).items() if key not in modifiers}
+    if not any(actions.values()):
         parser.print_help()
         return
 
@@ -206,19 +347,25 @@ def main():
         success = checkEnvironment() and success
 
     if args.all:
-        success = runAllTests() and success
+        success = runAllTests(args.jobs) and success
 
-    if args.unit:
-        success = runUnitTests() and success
+    suites = [suite for suite in ("unit", "integration", "ui") if getattr(args, suite)]
+    if args.batch and suites:
+        # 包含 UI 测试时沿用其单进程默认值
+        defaultJobs = UI_TEST_JOBS if args.ui else "auto"
+        success = runBatchTests(suites, args.jobs or defaultJobs) and success
+    else:
+        if args.unit:
+            success = runUnitTests(args.jobs or "auto") and success
 
-    if args.integration:
-        success = runIntegrationTests() and success
+        if args.integration:
+            success = runIntegrationTests(args.jobs or "auto") and success
 
-    if args.ui:
-        success = runUiTests() and success
+        if args.ui:
+            success = runUiTests(args.jobs or UI_TEST_JOBS) and success
 
     if args.fast:
-        success = runFastTests() and success
+        success = runFastTests(args.jobs) and success
 
     if args.coverage:
         success = runCoverageTests() and success
@@ -8,31 +8,57 @@ Git Hooks 管理脚本
 
 import os
 import sys
-import shutil
+import subprocess
 from pathlib import Path
 
 
 class GitHooksManager:
     """Git钩子管理器"""
 
+    # 受管理的钩子
+    HOOKS = ('pre-commit', 'pre-push')
+
     def __init__(self):
         self.projectRoot = Path(__file__).parent.parent
         self.hooksDir = self.projectRoot / '.git' / 'hooks'
         self.backupDir = self.projectRoot / '.git' / 'hooks_backup'
 
+    @staticmethod
+    def _listDir(directory):
+        """遍历一次目录，返回 {文件名: DirEntry}，目录不存在时返回空字典"""
+        try:
+            with os.scandir(directory) as entries:
+                return {entry.name: entry for entry in entries}
+        except FileNotFoundError:
+            return {}
+
+    def _scan(self):
+        """一次性扫描钩子目录和备份目录
+
+        Returns:
+            {钩子名: (钩子存在, 钩子可执行, 存在备份)}
+        """
+        hookEntries = self._listDir(self.hooksDir)
+        backupEntries = self._listDir(self.backupDir)
+
+        result = {}
+        for hook in self.HOOKS:
+            entry = hookEntries.get(hook)
+            exists = entry is not None
+            executable = exists and os.access(entry.path, os.X_OK)
+            result[hook] = (exists, executable, f"{hook}.disabled" in backupEntries)
+        return result
+
     def enableHooks(self):
         """启用Git钩子"""
         if not self.hooksDir.exists():
             print("❌ Git hooks目录不存在")
             return False
 
-        hooks = ['pre-commit', 'pre-push']
-        enabled = []
-
-        for hook in hooks:
-            hookPath = self.hooksDir / hook
-            if hookPath.exists() and os.access(hookPath, os.X_OK):
-                enabled.append(hook)
+        enabled = [
+            hook for hook, (_, executable, _) in self._scan().items()
+            if executable
+        ]
 
         if enabled:
             print(f"✅ 已启用的Git钩子: {', '.join(enabled)}")
@@ -50,15 +76,15 @@ class GitHooksManager:
         # 创建备份目录
         self.backupDir.mkdir(exist_ok=True)
 
-        hooks = ['pre-commit', 'pre-push']
         disabled = []
 
-        for hook in hooks:
+        for hook, (exists, _, _) in self._scan().items():
             hookPath = self.hooksDir / hook
             backupPath = self.backupDir / f"{hook}.disabled"
 
-            if hookPath.exists():
-                shutil.move(str(hookPath), str(backupPath))
+            if exists:
+                # 备份目录同在 .git 下，与钩子目录位于同一文件系统，直接原子重命名
+                os.replace(hookPath, backupPath)
                 disabled.append(hook)
 
         if disabled:
@@ -75,15 +101,14 @@ class GitHooksManager:
             print("❌ 没有找到备份的Git钩子")
             return False
 
-        hooks = ['pre-commit', 'pre-push']
         restored = []
 
-        for hook in hooks:
+        for hook, (_, _, hasBackup) in self._scan().items():
             backupPath = self.backupDir / f"{hook}.disabled"
             hookPath = self.hooksDir / hook
 
-            if backupPath.exists():
-                shutil.move(str(backupPath), str(hookPath))
+            if hasBackup:
+                os.replace(backupPath, hookPath)
                 os.chmod(hookPath, 0o755)  # 确保可执行
                 restored.append(hook)
 
@@ -99,15 +124,10 @@ class GitHooksManager:
         print("📋 Git钩子状态:")
         print("=" * 40)
 
-        hooks = ['pre-commit', 'pre-push']
-
-        for hook in hooks:
-            hookPath = self.hooksDir / hook
-            backupPath = self.backupDir / f"{hook}.disabled"
-
-            if hookPath.exists() and os.access(hookPath, os.X_OK):
+        for hook, (_, executable, hasBackup) in self._scan().items():
+            if executable:
                 status = "✅ 已启用"
-            elif backupPath.exists():
+            elif hasBackup:
                 status = "⏸️  已禁用 (有备份)"
             else:
                 status = "❌ 不存在"
@@ -122,8 +142,11 @@ class GitHooksManager:
         preCommitPath = self.hooksDir / 'pre-commit'
         if preCommitPath.exists() and os.access(preCommitPath, os.X_OK):
             print("\n🔍 测试pre-commit钩子:")
-            result = os.system(f"cd {self.projectRoot} && .git/hooks/pre-commit")
-            if result == 0:
+            # 直接执行钩子，不经过 shell，路径含空格时也不会出错
+            result = subprocess.run(
+                [str(preCommitPath)], cwd=str(self.projectRoot), check=False
+            )
+            if result.returncode == 0:
                 print("✅ pre-commit钩子测试通过")
             else:
                 print("❌ pre-commit钩子测试失败")
@@ -2,17 +2,60 @@
 # -*- coding: utf-8 -*-
 """
 用户信息查看工具
-使用方法: python view_users.py [local|remote]
+使用方法: python view_users.py [local|remote|all]
 """
 
+import contextlib
 import json
 import subprocess
 import sys
 import os
+import tempfile
 
+# ijson 为可选依赖：安装后边读取 wrangler 输出边解析，不必先缓冲完整结果
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
-def run_wrangler_command(database_type="remote"):
-    """执行 wrangler 命令查询用户数据"""
+
+JSON_ERRORS = (ValueError,) if ijson is None else (ValueError, ijson.JSONError)
+
+DATABASE_TYPES = ["local", "remote"]
+DATABASE_TYPE_TEXT = {"local": "本地", "remote": "远程", "all": "本地和远程"}
+
+
+def iter_query_results(stream, meta):
+    """从 wrangler --json 输出流中逐个产出查询结果行
+
+    查询元信息（meta）会在解析过程中写入传入的字典。
+    """
+    if ijson is None:
+        users_data = json.load(stream)
+        if users_data:
+            meta.update(users_data[0].get("meta") or {})
+            yield from users_data[0].get("results") or []
+        return
+
+    # 只为结果行和 meta 构建对象，其余事件直接跳过
+    current = None
+    for prefix, event, value in ijson.parse(stream):
+        if current is None:
+            if event != "start_map" or prefix not in ("item.results.item", "item.meta"):
+                continue
+            current = (prefix, ijson.ObjectBuilder())
+        start, builder = current
+        builder.event(event, value)
+        if event == "end_map" and prefix == start:
+            current = None
+            if start == "item.meta":
+                meta.update(builder.value)
+            else:
+                yield builder.value
+
+
+def start_wrangler(database_type, stderr_file):
+    """启动 wrangler 查询进程，不等待其结束"""
     # 切换到 worker 目录
     worker_dir = os.path.join(
         os.path.dirname(os.path.dirname(__file__)), "worker"
@@ -29,69 +72,112 @@ def run_wrangler_command(database_type="remote"):
     if database_type == "remote":
         cmd.append("--remote")
     
-    try:
-        result = subprocess.run(
-            cmd, cwd=worker_dir, capture_output=True, text=True, check=True
-        )
-        return json.loads(result.stdout)
-    except subprocess.CalledProcessError as e:
-        print(f"❌ 执行命令失败: {e}")
-        print(f"错误输出: {e.stderr}")
-        return None
-    except json.JSONDecodeError as e:
-        print(f"❌ 解析 JSON 失败: {e}")
-        return None
-
-
-def format_user_info(users_data):
-    """格式化用户信息显示"""
-    if not users_data or not users_data[0].get("results"):
-        print("📭 没有找到用户数据")
-        return
-    
-    users = users_data[0]["results"]
-    meta = users_data[0].get("meta", {})
+    return subprocess.Popen(
+        cmd, cwd=worker_dir, stdout=subprocess.PIPE,
+        stderr=stderr_file, text=True
+    )
+
+
+def print_wrangler_result(proc, stderr_file, out=None):
+    """读取 wrangler 输出并逐条显示用户信息，结束后汇报错误"""
+    meta = {}
+    parse_error = None
+    with proc:
+        try:
+            format_user_info(iter_query_results(proc.stdout, meta), meta, out)
+        except JSON_ERRORS as e:
+            parse_error = e
     
-    print(f"👥 用户列表 (共 {len(users)} 个用户)")
-    print("=" * 80)
+    if proc.returncode != 0:
+        stderr_file.seek(0)
+        print(f"❌ 执行命令失败: 退出码 {proc.returncode}", file=out)
+        print(f"错误输出: {stderr_file.read()}", file=out)
+    elif parse_error is not None:
+        print(f"❌ 解析 JSON 失败: {parse_error}", file=out)
+
+
+def run_wrangler_command(database_type="remote", out=None):
+    """执行 wrangler 命令查询用户数据，并逐条输出用户信息
+
+    database_type 为 'all' 时同时启动本地和远程两个 wrangler 进程，
+    让两次 Node 启动时间重叠，再依次读取输出，保证显示不交错。
+    """
+    database_types = DATABASE_TYPES if database_type == "all" else [database_type]
     
+    # stderr 写入临时文件，避免读取 stdout 时管道写满导致子进程阻塞
+    with contextlib.ExitStack() as stack:
+        runs = []
+        for db_type in database_types:
+            stderr_file = stack.enter_context(tempfile.TemporaryFile(mode="w+"))
+            runs.append((db_type, start_wrangler(db_type, stderr_file), stderr_file))
+
+        for db_type, proc, stderr_file in runs:
+            if len(runs) > 1:
+                print(f"\n🗄️  {DATABASE_TYPE_TEXT[db_type]}数据库", file=out)
+            print_wrangler_result(proc, stderr_file, out)
+
+
+def format_user_info(users, meta, out=None):
+    """格式化用户信息显示，边解析边输出
+
+    Args:
+        users: 用户记录的可迭代对象
+        meta: 查询元信息字典，在 users 迭代结束后填充完毕
+        out: 输出流，为 None 时输出到标准输出
+    """
+    count = 0
     for user in users:
-        print(f"🆔 ID: {user['id']}")
-        print(f"👤 用户名: {user['username']}")
-        print(f"📧 邮箱: {user['email']}")
-        print(f"📅 注册时间: {user['created_at']}")
-        print("-" * 40)
+        if count == 0:
+            print("👥 用户列表", file=out)
+            print("=" * 80, file=out)
+        count += 1
+        print(f"🆔 ID: {user['id']}", file=out)
+        print(f"👤 用户名: {user['username']}", file=out)
+        print(f"📧 邮箱: {user['email']}", file=out)
+        print(f"📅 注册时间: {user['created_at']}", file=out)
+        print("-" * 40, file=out)
+
+    if count == 0:
+        print("📭 没有找到用户数据", file=out)
+        return
+
+    print(f"共 {count} 个用户", file=out)
     
     # 显示查询元信息
     if meta:
-        print("\n📊 查询信息:")
+        print("\n📊 查询信息:", file=out)
         if "duration" in meta:
-            print(f"   ⏱️  查询耗时: {meta['duration']} ms")
+            print(f"   ⏱️  查询耗时: {meta['duration']} ms", file=out)
         if "served_by_region" in meta:
-            print(f"   🌍 服务区域: {meta['served_by_region']}")
+            print(f"   🌍 服务区域: {meta['served_by_region']}", file=out)
         if "rows_read" in meta:
-            print(f"   📖 读取行数: {meta['rows_read']}")
+            print(f"   📖 读取行数: {meta['rows_read']}", file=out)
+
 
+def main(database_type=None, out=None):
+    """主函数
 
-def main():
-    """主函数"""
-    database_type = sys.argv[1] if len(sys.argv) > 1 else "remote"
+    Args:
+        database_type: 数据库类型 ('local'、'remote' 或 'all')，为 None 时从命令行参数读取
+        out: 输出流，为 None 时输出到标准输出；在线程中调用时应传入独立的缓冲区
+    """
+    if database_type is None:
+        database_type = sys.argv[1] if len(sys.argv) > 1 else "remote"
     
-    if database_type not in ["local", "remote"]:
-        print("❌ 参数错误，请使用 'local' 或 'remote'")
+    if database_type not in DATABASE_TYPE_TEXT:
+        print("❌ 参数错误，请使用 'local'、'remote' 或 'all'", file=out)
         sys.exit(1)
     
-    db_type_text = "本地" if database_type == "local" else "远程"
-    print(f"📊 正在查看 {db_type_text} 数据库用户信息...\n")
+    db_type_text = DATABASE_TYPE_TEXT[database_type]
+    print(f"📊 正在查看 {db_type_text} 数据库用户信息...\n", file=out)
     
-    users_data = run_wrangler_command(database_type)
-    if users_data:
-        format_user_info(users_data)
+    run_wrangler_command(database_type, out)
     
-    print("\n💡 使用提示:")
-    print("   python view_users.py local   # 查看本地数据库")
-    print("   python view_users.py remote  # 查看远程数据库")
-    print("   python view_users.py         # 默认查看远程数据库")
+    print("\n💡 使用提示:", file=out)
+    print("   python view_users.py local   # 查看本地数据库", file=out)
+    print("   python view_users.py remote  # 查看远程数据库", file=out)
+    print("   python view_users.py all     # 同时查看本地和远程数据库", file=out)
+    print("   python view_users.py         # 默认查看远程数据库", file=out)
 
 
 if __name__ == "__main__":
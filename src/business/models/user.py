@@ -4,12 +4,22 @@
 用户模型
 """
 
-from typing import Optional, Dict, Any
+import re
+import sys
+from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+# Python 3.10+ 的 dataclass 支持 slots，去掉实例 __dict__ 以节省内存并加快属性访问；
+# 更早的版本（项目最低支持 3.8）保持普通 dataclass
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# 含有非空白字符即视为非空，避免每次校验都 strip 出新字符串
+_NON_BLANK_RE = re.compile(r'\S')
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class User:
     """用户数据模型"""
 
@@ -28,16 +38,19 @@ class User:
 
     def __post_init__(self):
         """初始化后处理"""
-        if self.createdAt is None:
-            self.createdAt = datetime.now()
-        if self.updatedAt is None:
-            self.updatedAt = datetime.now()
+        # 只取一次当前时间，保证创建时间与更新时间一致
+        if self.createdAt is None or self.updatedAt is None:
+            now = datetime.now()
+            if self.createdAt is None:
+                self.createdAt = now
+            if self.updatedAt is None:
+                self.updatedAt = now
 
     def isValid(self) -> bool:
         """检查用户数据是否有效"""
         return (
             self.username is not None and
-            len(self.username.strip()) > 0 and
+            _NON_BLANK_RE.search(self.username) is not None and
             self.email is not None and
             '@' in self.email
         )
@@ -95,10 +108,53 @@ class User:
             metadata=data.get('metadata', {})
         )
 
+    @classmethod
+    def fromDictList(cls, rows: List[Dict[str, Any]]) -> List['User']:
+        """批量从字典创建用户对象
+
+        与逐行调用 fromDict 结果相同，但将解析函数等查找提到循环外，
+        适合一次性反序列化整张用户表。用户名和邮箱会被驻留（sys.intern），
+        审计日志等同一用户反复出现的列表中，重复值只保留一份字符串。
+
+        Args:
+            rows: 用户数据字典列表
+
+        Returns:
+            用户对象列表
+        """
+        fromIso = datetime.fromisoformat
+        intern = sys.intern
+
+        def parseTime(data, key):
+            value = data.get(key)
+            return fromIso(value) if value else None
+
+        def internStr(data, key):
+            value = data.get(key, '')
+            return intern(value) if value else value
+
+        return [
+            cls(
+                id=data.get('id'),
+                username=internStr(data, 'username'),
+                email=internStr(data, 'email'),
+                passwordHash=data.get('passwordHash', ''),
+                salt=data.get('salt', ''),
+                isActive=data.get('isActive', True),
+                isVerified=data.get('isVerified', False),
+                createdAt=parseTime(data, 'createdAt'),
+                updatedAt=parseTime(data, 'updatedAt'),
+                lastLogin=parseTime(data, 'lastLogin'),
+                metadata=data.get('metadata', {})
+            )
+            for data in rows
+        ]
+
     def updateLoginTime(self) -> None:
         """更新最后登录时间"""
-        self.lastLogin = datetime.now()
-        self.updatedAt = datetime.now()
+        now = datetime.now()
+        self.lastLogin = now
+        self.updatedAt = now
 
     def __str__(self) -> str:
         """字符串表示"""
@@ -115,7 +171,7 @@ class User:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class LoginRequest:
     """登录请求数据模型"""
     username: str
@@ -127,7 +183,7 @@ class LoginRequest:
         return bool(self.username) and bool(self.password)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class RegisterRequest:
     """注册请求数据模型"""
     username: str
@@ -145,7 +201,7 @@ class RegisterRequest:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AuthResponse:
     """认证响应数据模型"""
     success: bool
@@ -4,15 +4,42 @@
 用户认证服务 - 处理登录、注册等认证相关业务逻辑
 """
 
+from functools import cached_property, partial
 from typing import Optional
-from business.models.user import User, LoginRequest, RegisterRequest
+from business.models.user import User, RegisterRequest
 from business.validators.user_validator import UserValidator
+from business.services.auth_service_core import (
+    buildLoginRequest, checkLoginRequest, checkRegisterRequest
+)
 from data.api.auth_client import AuthClient
 # 移除JWTManager导入，改为使用云端验证
 from infrastructure.config.app_config import AppConfig
 from infrastructure.logging.logger import getLogger
 from business.services.session_manager import SessionManager
-from PyQt6.QtCore import QObject, pyqtSignal, QTimer
+from PyQt6.QtCore import (
+    Qt, QObject, QRunnable, QThreadPool, pyqtSignal, QTimer
+)
+
+
+class AuthTaskSignals(QObject):
+    """认证任务的信号（QRunnable 不是 QObject，不能直接定义信号）"""
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class AuthTask(QRunnable):
+    """在线程池中执行一次阻塞的认证调用，结果通过信号回到主线程"""
+
+    def __init__(self, call):
+        super().__init__()
+        self.call = call
+        self.signals = AuthTaskSignals()
+
+    def run(self):
+        try:
+            self.signals.finished.emit(self.call())
+        except Exception as e:
+            self.signals.failed.emit(str(e))
 
 
 class AuthService(QObject):
@@ -31,35 +58,61 @@ class AuthService(QObject):
     resetPasswordSuccess = pyqtSignal(str)
     resetPasswordFailed = pyqtSignal(str)
 
-    def __init__(self, configManager: Optional[AppConfig] = None):
+    def __init__(self, configManager: Optional[AppConfig] = None,
+                 autoLogin: bool = True):
+        """初始化认证服务
+
+        Args:
+            configManager: 配置管理器
+            autoLogin: 是否自动恢复保存的会话。恢复需要读取会话文件并请求服务器，
+                因此推迟到事件循环开始后执行，不阻塞窗口首次绘制；
+                自行调用 tryAutoLogin 的调用方应传入 False
+        """
         super().__init__()
         self.config = configManager or AppConfig()
         self.logger = getLogger('auth_service')
-        self.validator = UserValidator()
-        self.authClient = AuthClient()
+        # 验证器只含类方法和预编译的正则，直接引用类即可，无需实例化
+        self.validator = UserValidator
         # 移除本地JWT管理器，改为使用云端验证
 
         # 会话管理器
         self.sessionManager = SessionManager()
         self._connectSessionSignals()
 
-        # 自动刷新定时器
-        self.autoRefreshTimer = QTimer()
-        self.autoRefreshTimer.timeout.connect(self._autoRefreshToken)
-
         # 尝试恢复保存的会话
-        self.tryAutoLogin()
+        if autoLogin:
+            QTimer.singleShot(0, self._deferredAutoLogin)
+
+    @cached_property
+    def authClient(self) -> AuthClient:
+        """认证API客户端（与会话管理器共用同一个实例，首次使用时创建）"""
+        return self.sessionManager.authClient
+
+    def _deferredAutoLogin(self):
+        """事件循环开始后恢复会话（此前已登录或已恢复时跳过）"""
+        if not self.isLoggedIn():
+            self.tryAutoLogin()
 
     def _connectSessionSignals(self):
-        """连接会话管理器信号"""
+        """连接会话管理器信号
+
+        会话管理器的信号都由主线程中的定时器或调用触发，直接连接即可，
+        省去每次发射时的线程判断。
+        """
+        direct = Qt.ConnectionType.DirectConnection
         self.sessionManager.sessionRestored.connect(
-            self._onSessionRestored)
+            self._onSessionRestored, direct)
         self.sessionManager.sessionExpired.connect(
-            self._onSessionExpired)
+            self._onSessionExpired, direct)
         self.sessionManager.autoLoginSuccess.connect(
-            self._onAutoLoginSuccess)
+            self._onAutoLoginSuccess, direct)
         self.sessionManager.autoLoginFailed.connect(
-            self._onAutoLoginFailed)
+            self._onAutoLoginFailed, direct)
+        # 刷新时机由会话管理器的令牌检查定时器决定，这里只负责在线程池中请求
+        self.sessionManager.tokenRefreshDue.connect(
+            self._autoRefreshToken, direct)
+        self.sessionManager.tokenVerifyDue.connect(
+            self._autoVerifyToken, direct)
 
     def tryAutoLogin(self):
         """尝试自动登录"""
@@ -97,39 +150,73 @@ class AuthService(QObject):
         """自动登录失败处理"""
         self.logger.warning(f"自动登录失败: {errorMsg}")
 
+    def _runTask(self, call, onFinished, onFailed):
+        """将网络调用提交到全局线程池，避免阻塞界面线程
+
+        Args:
+            call: 在工作线程中执行的无参可调用对象
+            onFinished: 调用成功时在主线程执行的回调，参数为返回值
+            onFailed: 调用抛出异常时在主线程执行的回调，参数为错误信息
+        """
+        # 信号在工作线程中发射，显式使用队列连接，回调总是在主线程执行
+        queued = Qt.ConnectionType.QueuedConnection
+        task = AuthTask(call)
+        task.signals.finished.connect(onFinished, queued)
+        task.signals.failed.connect(onFailed, queued)
+        QThreadPool.globalInstance().start(task)
+
+    def _reportError(self, failedSignal, prefix: str, error: str):
+        """记录请求异常并通过对应的失败信号通知
+
+        Args:
+            failedSignal: 失败信号，如 loginFailed
+            prefix: 错误信息前缀，如 "登录失败"
+            error: 异常信息
+        """
+        errorMsg = f"{prefix}: {error}"
+        self.logger.error(errorMsg)
+        failedSignal.emit(errorMsg)
+
+    def _errorHandler(self, failedSignal, prefix: str):
+        """生成 _runTask 使用的异常回调"""
+        return partial(self._reportError, failedSignal, prefix)
+
     def login(self, username: str, password: str,
               remember: bool = False) -> bool:
         """用户登录
 
+        网络请求在线程池中执行，结果通过 loginSuccess / loginFailed 信号通知。
+
         Args:
             username: 用户名或邮箱
             password: 密码
             remember: 是否记住密码
 
         Returns:
-            bool: 登录是否成功
+            bool: 登录请求是否已提交（输入验证失败时为 False）
         """
-        try:
-            # 创建登录请求
-            loginRequest = LoginRequest(
-                username=username,
-                password=password,
-                rememberMe=remember
-            )
+        # 创建登录请求
+        loginRequest = buildLoginRequest(username, password, remember)
 
-            # 验证输入
-            validationErrors = self.validator.validateLoginRequest(
-                loginRequest
-            )
-            if validationErrors:
-                errorMsg = '; '.join(validationErrors)
-                self.logger.warning(f"登录验证失败: {errorMsg}")
-                self.loginFailed.emit(errorMsg)
-                return False
+        # 验证输入
+        errorMsg = checkLoginRequest(loginRequest)
+        if errorMsg:
+            self.logger.warning(f"登录验证失败: {errorMsg}")
+            self.loginFailed.emit(errorMsg)
+            return False
 
-            # 调用API
-            authResponse = self.authClient.login(loginRequest)
+        # 调用API
+        self._runTask(
+            lambda: self.authClient.login(loginRequest),
+            lambda authResponse: self._onLoginResponse(
+                authResponse, username, remember),
+            self._errorHandler(self.loginFailed, "登录失败")
+        )
+        return True
 
+    def _onLoginResponse(self, authResponse, username: str, remember: bool):
+        """登录接口返回后的处理（主线程）"""
+        try:
             # 检查登录是否成功
             if authResponse.success:
                 # 使用会话管理器开始会话
@@ -140,86 +227,70 @@ class AuthService(QObject):
                     rememberMe=remember
                 )
 
-                # 启动自动刷新
-                self._startAutoRefresh()
-
                 self.logger.info(f"用户 {username} 登录成功")
                 self.loginSuccess.emit(authResponse.toDict())
-                return True
             else:
                 # 登录失败
                 errorMsg = authResponse.message or "登录失败"
                 self.logger.warning(f"用户 {username} 登录失败: {errorMsg}")
                 self.loginFailed.emit(errorMsg)
-                return False
 
         except Exception as e:
-            errorMsg = f"登录失败: {str(e)}"
-            self.logger.error(errorMsg)
-            self.loginFailed.emit(errorMsg)
-            return False
+            self._reportError(self.loginFailed, "登录失败", str(e))
 
     def register(self, registerRequest: RegisterRequest) -> bool:
         """用户注册
 
+        网络请求在线程池中执行，结果通过 registerSuccess / registerFailed 信号通知。
+
         Args:
-            username: 用户名
-            email: 邮箱
-            password: 密码
-            confirm_password: 确认密码
+            registerRequest: 注册请求对象
 
         Returns:
-            bool: 注册是否成功
+            bool: 注册请求是否已提交（输入验证失败时为 False）
         """
-        try:
-            # 验证输入
-            validationErrors = self.validator.validateRegisterRequest(
-                registerRequest
-            )
-            if validationErrors:
-                errorMsg = '; '.join(validationErrors)
-                self.logger.warning(f"注册验证失败: {errorMsg}")
-                self.registerFailed.emit(errorMsg)
-                return False
-
-            # 调用API
-            authResponse = self.authClient.register(registerRequest)
-
-            self.logger.info(f"用户 {registerRequest.username} 注册成功")
-            self.registerSuccess.emit(authResponse.toDict())
-            return True
-
-        except Exception as e:
-            errorMsg = f"注册失败: {str(e)}"
-            self.logger.error(errorMsg)
+        # 验证输入
+        errorMsg = checkRegisterRequest(registerRequest)
+        if errorMsg:
+            self.logger.warning(f"注册验证失败: {errorMsg}")
             self.registerFailed.emit(errorMsg)
             return False
 
-    def logout(self) -> bool:
-        """用户登出"""
-        try:
-            accessToken = self.sessionManager.getAccessToken()
-            if accessToken:
-                # 调用API登出
-                self.authClient.logout(accessToken)
+        # 调用API
+        self._runTask(
+            lambda: self.authClient.register(registerRequest),
+            lambda authResponse: self._onRegisterResponse(
+                authResponse, registerRequest.username),
+            self._errorHandler(self.registerFailed, "注册失败")
+        )
+        return True
 
-            # 结束会话
-            self.sessionManager.endSession()
+    def _onRegisterResponse(self, authResponse, username: str):
+        """注册接口返回后的处理（主线程）"""
+        self.logger.info(f"用户 {username} 注册成功")
+        self.registerSuccess.emit(authResponse.toDict())
 
-            # 停止自动刷新
-            self.autoRefreshTimer.stop()
+    def logout(self) -> bool:
+        """用户登出
 
-            self.logger.info("用户登出成功")
-            self.logoutSuccess.emit()
-            return True
+        本地会话立即清除，服务器端登出请求在线程池中执行，不等待其结果。
+        """
+        accessToken = self.sessionManager.getAccessToken()
+        if accessToken:
+            # 调用API登出：客户端与会话管理器共用，令牌随调用传入而不写入客户端，
+            # 后台登出不会清掉随后重新登录设置的令牌
+            self._runTask(
+                lambda: self.authClient.logout(accessToken),
+                lambda authResponse: None,
+                lambda error: self.logger.error(f"登出失败: {error}")
+            )
 
-        except Exception as e:
-            self.logger.error(f"登出失败: {str(e)}")
-            # 即使API调用失败，也清除本地状态
-            self.sessionManager.endSession()
-            self.autoRefreshTimer.stop()
-            self.logoutSuccess.emit()
-            return False
+        # 结束会话
+        self.sessionManager.endSession()
+
+        self.logger.info("用户登出成功")
+        self.logoutSuccess.emit()
+        return True
 
     def isLoggedIn(self) -> bool:
         """检查是否已登录"""
@@ -233,35 +304,62 @@ class AuthService(QObject):
         """获取访问令牌"""
         return self.sessionManager.getAccessToken()
 
-    def _startAutoRefresh(self):
-        """启动自动刷新令牌"""
+    def _autoVerifyToken(self):
+        """在线程池中向服务器确认不透明令牌是否有效（响应 tokenVerifyDue）"""
         accessToken = self.sessionManager.getAccessToken()
-        if accessToken:
-            # 使用固定间隔刷新令牌（每25分钟刷新一次）
-            try:
-                # 启动定时器，25分钟后刷新
-                refreshInterval = 25 * 60 * 1000  # 25分钟转换为毫秒
-                self.autoRefreshTimer.start(refreshInterval)
-                self.logger.info("自动刷新定时器已启动")
-            except Exception as e:
-                self.logger.warning(f"设置自动刷新失败: {str(e)}")
+        if not self.isLoggedIn() or self.sessionManager.isRefreshing():
+            return
+
+        self._runTask(
+            lambda: self.sessionManager.verifyTokenWithServer(accessToken),
+            partial(self._onAutoVerifyResult, accessToken),
+            self._onAutoRefreshError
+        )
+
+    def _onAutoVerifyResult(self, accessToken: str, isValid: bool):
+        """令牌验证结果处理（主线程）：令牌失效时刷新"""
+        # 验证期间令牌已更换（刷新、重新登录或登出）时结果不再适用
+        if isValid or self.sessionManager.getAccessToken() != accessToken:
+            return
+
+        self.logger.info("访问令牌已失效，请求刷新")
+        self._autoRefreshToken()
 
     def _autoRefreshToken(self):
-        """自动刷新令牌"""
-        try:
-            refreshToken = self.sessionManager.getRefreshToken()
-            if refreshToken:
-                # 使用会话管理器的刷新方法
-                if self.sessionManager._refreshToken(refreshToken):
-                    newToken = self.sessionManager.getAccessToken()
-                    self.tokenRefreshed.emit(newToken)
-                    self._startAutoRefresh()
-                else:
-                    self.logger.warning("令牌刷新失败")
-                    self.sessionExpired.emit()
-        except Exception as e:
-            self.logger.error(f"自动刷新令牌失败: {str(e)}")
-            self.sessionExpired.emit()
+        """自动刷新令牌（响应会话管理器的 tokenRefreshDue）"""
+        if not self.isLoggedIn() or self.sessionManager.isRefreshing():
+            # 未登录，或上一次刷新尚未返回
+            return
+
+        refreshToken = self.sessionManager.getRefreshToken()
+        if refreshToken:
+            # 线程池中只请求新令牌，会话状态在主线程的结果处理中更新
+            self._runTask(
+                lambda: self.sessionManager.fetchRefreshedTokens(refreshToken),
+                partial(self._onAutoRefreshResult, refreshToken),
+                self._onAutoRefreshError
+            )
+
+    def _onAutoRefreshResult(self, refreshToken: str, authResponse):
+        """自动刷新结果处理（主线程）"""
+        if not self.isLoggedIn():
+            # 刷新期间用户已登出或会话已结束，丢弃刷新结果
+            return
+
+        if authResponse is None:
+            self.logger.warning("令牌刷新失败")
+            self._onSessionExpired()
+            return
+
+        # 令牌在刷新期间已被替换时结果被丢弃；应用成功时会话管理器按新令牌重新安排检查
+        if self.sessionManager.applyRefreshedTokens(refreshToken, authResponse):
+            newToken = self.sessionManager.getAccessToken()
+            self.tokenRefreshed.emit(newToken)
+
+    def _onAutoRefreshError(self, error: str):
+        """自动刷新异常处理"""
+        self.logger.error(f"自动刷新令牌失败: {error}")
+        self._onSessionExpired()
 
     def changePassword(self, oldPassword: str, newPassword: str,
                        confirmPassword: str) -> bool:
@@ -291,69 +389,71 @@ class AuthService(QObject):
     def forgotPassword(self, email: str) -> bool:
         """忘记密码
 
+        网络请求在线程池中执行，结果通过 forgotPasswordSuccess /
+        forgotPasswordFailed 信号通知。
+
         Args:
             email: 邮箱地址
 
         Returns:
-            bool: 请求是否成功
+            bool: 请求是否已提交
         """
-        try:
-            # 验证邮箱格式
-            if not self.validator.validateEmail(email):
-                self.logger.warning(f"邮箱格式不正确: {email}")
-                self.forgotPasswordFailed.emit("邮箱格式不正确")
-                return False
-
-            # 调用API
-            authResponse = self.authClient.forgotPassword(email)
+        # 验证邮箱格式
+        if not self.validator.validateEmail(email):
+            self.logger.warning(f"邮箱格式不正确: {email}")
+            self.forgotPasswordFailed.emit("邮箱格式不正确")
+            return False
 
-            if authResponse.success:
-                self.logger.info(f"忘记密码请求成功: {email}")
-                self.forgotPasswordSuccess.emit(authResponse.message)
-                return True
-            else:
-                self.logger.warning(f"忘记密码请求失败: {authResponse.message}")
-                self.forgotPasswordFailed.emit(authResponse.message)
-                return False
+        # 调用API
+        self._runTask(
+            lambda: self.authClient.forgotPassword(email),
+            lambda authResponse: self._onForgotPasswordResponse(
+                authResponse, email),
+            self._errorHandler(self.forgotPasswordFailed, "忘记密码请求失败")
+        )
+        return True
 
-        except Exception as e:
-            errorMsg = f"忘记密码请求失败: {str(e)}"
-            self.logger.error(errorMsg)
-            self.forgotPasswordFailed.emit(errorMsg)
-            return False
+    def _onForgotPasswordResponse(self, authResponse, email: str):
+        """忘记密码接口返回后的处理（主线程）"""
+        if authResponse.success:
+            self.logger.info(f"忘记密码请求成功: {email}")
+            self.forgotPasswordSuccess.emit(authResponse.message)
+        else:
+            self.logger.warning(f"忘记密码请求失败: {authResponse.message}")
+            self.forgotPasswordFailed.emit(authResponse.message)
 
     def resetPassword(self, token: str, newPassword: str) -> bool:
         """重置密码
 
+        网络请求在线程池中执行，结果通过 resetPasswordSuccess /
+        resetPasswordFailed 信号通知。
+
         Args:
             token: 重置令牌
             newPassword: 新密码
 
         Returns:
-            bool: 重置是否成功
+            bool: 请求是否已提交
         """
-        try:
-            # 验证新密码
-            if len(newPassword) < 6:
-                self.logger.warning("新密码长度不足")
-                self.resetPasswordFailed.emit("密码长度至少6位")
-                return False
-
-            # 调用API
-            authResponse = self.authClient.resetPassword(
-                token, newPassword)
+        # 验证新密码
+        if len(newPassword) < 6:
+            self.logger.warning("新密码长度不足")
+            self.resetPasswordFailed.emit("密码长度至少6位")
+            return False
 
-            if authResponse.success:
-                self.logger.info("密码重置成功")
-                self.resetPasswordSuccess.emit(authResponse.message)
-                return True
-            else:
-                self.logger.warning(f"密码重置失败: {authResponse.message}")
-                self.resetPasswordFailed.emit(authResponse.message)
-                return False
+        # 调用API
+        self._runTask(
+            lambda: self.authClient.resetPassword(token, newPassword),
+            self._onResetPasswordResponse,
+            self._errorHandler(self.resetPasswordFailed, "密码重置失败")
+        )
+        return True
 
-        except Exception as e:
-            errorMsg = f"密码重置失败: {str(e)}"
-            self.logger.error(errorMsg)
-            self.resetPasswordFailed.emit(errorMsg)
-            return False
+    def _onResetPasswordResponse(self, authResponse):
+        """重置密码接口返回后的处理（主线程）"""
+        if authResponse.success:
+            self.logger.info("密码重置成功")
+            self.resetPasswordSuccess.emit(authResponse.message)
+        else:
+            self.logger.warning(f"密码重置失败: {authResponse.message}")
+            self.resetPasswordFailed.emit(authResponse.message)
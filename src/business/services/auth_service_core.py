@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+用户认证服务核心逻辑 - 构造与校验认证请求
+
+本模块不依赖 PyQt6，AuthService 在此基础上负责信号、会话与网络调用；
+单元测试可以直接导入本模块，而不必加载 Qt。
+"""
+
+from typing import List, Optional
+from business.models.user import LoginRequest, RegisterRequest
+from business.validators.user_validator import UserValidator
+
+
+def buildLoginRequest(username: str, password: str,
+                      remember: bool = False) -> LoginRequest:
+    """创建登录请求
+
+    Args:
+        username: 用户名或邮箱
+        password: 密码
+        remember: 是否记住密码
+
+    Returns:
+        登录请求对象
+    """
+    return LoginRequest(
+        username=username,
+        password=password,
+        rememberMe=remember
+    )
+
+
+def joinErrors(errors: List[str]) -> Optional[str]:
+    """将验证错误列表合并为一条提示信息，没有错误时返回 None"""
+    return '; '.join(errors) if errors else None
+
+
+def checkLoginRequest(request: LoginRequest) -> Optional[str]:
+    """验证登录请求
+
+    Args:
+        request: 登录请求对象
+
+    Returns:
+        验证失败时的错误信息，通过时返回 None
+    """
+    return joinErrors(UserValidator.validateLoginRequest(request))
+
+
+def checkRegisterRequest(request: RegisterRequest) -> Optional[str]:
+    """验证注册请求
+
+    Args:
+        request: 注册请求对象
+
+    Returns:
+        验证失败时的错误信息，通过时返回 None
+    """
+    return joinErrors(UserValidator.validateRegisterRequest(request))
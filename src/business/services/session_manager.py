@@ -5,13 +5,33 @@
 负责用户会话的持久化、自动登录和会话过期管理
 """
 
+import base64
+import binascii
+import hashlib
+import hmac
 import json
 import os
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
-from PyQt6.QtCore import QObject, pyqtSignal, QTimer
-
-from business.models.user import User
+import platform
+import threading
+import time
+import uuid
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from datetime import datetime
+from functools import cached_property
+from typing import Optional, Dict, Any, Tuple
+from PyQt6.QtCore import QCoreApplication, QObject, pyqtSignal, QTimer
+
+try:
+    import orjson
+except ImportError:  # 未安装 orjson 时退回标准库 json
+    orjson = None
+
+try:
+    import keyring
+except ImportError:  # 未安装 keyring 时令牌仍以明文保存在会话文件中
+    keyring = None
+
+from business.models.user import User, AuthResponse
 from infrastructure.config.app_config import AppConfig
 from infrastructure.logging.logger import getLogger
 from data.api.auth_client import AuthClient
@@ -25,6 +45,31 @@ class SessionManager(QObject):
     sessionExpired = pyqtSignal()  # 会话过期信号
     autoLoginSuccess = pyqtSignal(dict)  # 自动登录成功信号
     autoLoginFailed = pyqtSignal(str)  # 自动登录失败信号
+    # 访问令牌需要刷新 / 不透明令牌需要向服务器确认是否有效：
+    # 由认证服务在线程池中完成请求，主线程不发起网络请求
+    tokenRefreshDue = pyqtSignal()
+    tokenVerifyDue = pyqtSignal()
+
+    # 工作线程等待进行中的令牌刷新结果的最长时间（秒），主线程从不等待
+    REFRESH_WAIT_TIMEOUT = 30
+
+    # 超过该时长（秒）无活动即视为会话不活跃
+    INACTIVE_THRESHOLD = 2 * 60 * 60
+
+    # 令牌检查的间隔（秒）：无法本地解析过期时间的令牌按固定间隔检查，
+    # 可解析的令牌按实际过期时间安排，但两次检查至少间隔一分钟
+    TOKEN_CHECK_INTERVAL = 5 * 60
+    MIN_TOKEN_CHECK_INTERVAL = 60
+
+    # QTimer 支持的最长间隔（毫秒）
+    MAX_TIMER_INTERVAL_MS = 2 ** 31 - 1
+
+    # 系统密钥环中保存令牌使用的服务名，以及需要移出会话文件的令牌字段
+    KEYRING_SERVICE = 'myqt6app'
+    TOKEN_FIELDS = ('accessToken', 'refreshToken')
+
+    # 本机密钥，首次使用时派生
+    _machineKey: Optional[bytes] = None
 
     def __init__(self):
         super().__init__()
@@ -32,7 +77,6 @@ class SessionManager(QObject):
         # 初始化依赖
         self.config = AppConfig()
         self.logger = getLogger('session_manager')
-        self.authClient = AuthClient()
 
         # 会话数据
         self.currentUser: Optional[User] = None
@@ -40,20 +84,43 @@ class SessionManager(QObject):
         self.refreshToken: Optional[str] = None
         self.sessionData: Dict[str, Any] = {}
 
+        # 令牌验证结果缓存：{令牌摘要: (验证结果, 过期时刻)}，避免短时间内重复请求服务器
+        self._verifyCache: Dict[str, Tuple[bool, float]] = {}
+
+        # 令牌刷新单飞控制：同一时间只发出一个刷新请求，其余调用者等待其结果
+        self._refreshLock = threading.Lock()
+        self._refreshInFlight: Optional[Future] = None
+
+        # 已写入密钥环的令牌：{令牌字段: 令牌指纹}，令牌未变化时不重复写入
+        self._keyringIds: Dict[str, str] = {}
+
         # 会话文件路径
         self.sessionFile = os.path.join(
             self.config.get('app.data_dir', 'data'),
             'session.json'
         )
 
-        # 自动刷新定时器
+        # 自动刷新定时器：单次触发，按令牌实际过期时间安排
         self.refreshTimer = QTimer()
+        self.refreshTimer.setSingleShot(True)
         self.refreshTimer.timeout.connect(self._checkTokenExpiry)
 
-        # 会话检查定时器
+        # 会话检查定时器：单次触发，安排在无活动阈值到达的时刻
         self.sessionTimer = QTimer()
+        self.sessionTimer.setSingleShot(True)
         self.sessionTimer.timeout.connect(self._validateSession)
 
+        # 会话文件延迟写入：活动时间只更新内存，定时合并写盘
+        self._sessionDirty = False
+        # 最近一次写入文件的内容摘要，内容未变化时跳过写盘
+        self._lastWrittenHash: Optional[bytes] = None
+        self._flushTimer = QTimer()
+        self._flushTimer.setSingleShot(True)
+        self._flushTimer.timeout.connect(self._flushSessionIfDirty)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._flushSessionIfDirty)
+
         self.logger.info("会话管理器初始化完成")
 
     def startSession(self, user: User, accessToken: str, refreshToken: str, rememberMe: bool = False):
@@ -63,14 +130,14 @@ class SessionManager(QObject):
             self.accessToken = accessToken
             self.refreshToken = refreshToken
 
-            # 构建会话数据
+            # 构建会话数据（时间均为整数 Unix 时间戳；令牌只保存在实例属性中，
+            # 写文件时才合并进去）
+            now = int(time.time())
             self.sessionData = {
                 'user': user.toDict(),
-                'accessToken': accessToken,
-                'refreshToken': refreshToken,
-                'loginTime': datetime.now().isoformat(),
+                'loginTime': now,
                 'rememberMe': rememberMe,
-                'lastActivity': datetime.now().isoformat()
+                'lastActivity': now
             }
 
             # 如果选择记住登录状态，保存到文件
@@ -89,15 +156,18 @@ class SessionManager(QObject):
     def endSession(self):
         """结束当前会话"""
         try:
-            # 停止定时器
+            # 停止定时器（会话文件随后删除，无需再写入未落盘的活动时间）
             self.refreshTimer.stop()
             self.sessionTimer.stop()
+            self._flushTimer.stop()
+            self._sessionDirty = False
 
             # 清除会话数据
             self.currentUser = None
             self.accessToken = None
             self.refreshToken = None
             self.sessionData.clear()
+            self._verifyCache.clear()
 
             # 删除会话文件
             self._clearSessionFile()
@@ -114,8 +184,8 @@ class SessionManager(QObject):
                 self.logger.debug("没有找到保存的会话文件")
                 return False
 
-            with open(self.sessionFile, 'r', encoding='utf-8') as f:
-                sessionData = json.load(f)
+            with open(self.sessionFile, 'rb') as f:
+                sessionData = self._loadTokens(self._loadsSession(f.read()))
 
             # 验证会话数据
             if not self._validateSessionData(sessionData):
@@ -123,24 +193,27 @@ class SessionManager(QObject):
                 self._clearSessionFile()
                 return False
 
+            # 令牌以实例属性为准，不保留在会话数据中
+            accessToken = sessionData.pop('accessToken')
+            refreshToken = sessionData.pop('refreshToken')
+
             # 检查令牌是否过期（通过云端验证）
-            accessToken = sessionData.get('accessToken')
-            if not self._verifyTokenWithServer(accessToken):
+            if self.verifyTokenWithServer(accessToken):
+                self.accessToken = accessToken
+                self.refreshToken = refreshToken
+            else:
                 self.logger.info("访问令牌已过期或无效，尝试刷新")
-                refreshToken = sessionData.get('refreshToken')
-                if refreshToken and self._refreshToken(refreshToken):
-                    # 刷新成功，重新验证
-                    return self.restoreSession()
-                return False
+                # 刷新成功时 updateTokens 已设置新令牌，新令牌刚由服务器签发，
+                # 无需重新读取文件和再次验证
+                if not (refreshToken and self._refreshToken(refreshToken)):
+                    return False
 
             # 恢复会话
             self.sessionData = sessionData
-            self.accessToken = sessionData['accessToken']
-            self.refreshToken = sessionData['refreshToken']
             self.currentUser = User.fromDict(sessionData['user'])
 
-            # 更新最后活动时间
-            self.sessionData['lastActivity'] = datetime.now().isoformat()
+            # 更新最后活动时间（旧版 ISO 格式的时间在此一并以时间戳重新保存）
+            self.sessionData['lastActivity'] = int(time.time())
             self._saveSessionToFile()
 
             # 启动定时器
@@ -157,11 +230,24 @@ class SessionManager(QObject):
             return False
 
     def updateActivity(self):
-        """更新用户活动时间"""
+        """更新用户活动时间
+
+        调用可能很频繁，因此只更新内存中的时间戳；需要持久化时由单次定时器
+        合并写盘，每个间隔内最多写一次文件。
+        """
         if self.isActive():
-            self.sessionData['lastActivity'] = datetime.now().isoformat()
+            self.sessionData['lastActivity'] = int(time.time())
             if self.sessionData.get('rememberMe', False):
-                self._saveSessionToFile()
+                self._sessionDirty = True
+                if not self._flushTimer.isActive():
+                    self._flushTimer.start(
+                        self.config.get('session.flush_interval_ms', 10000)
+                    )
+
+    def _flushSessionIfDirty(self):
+        """将尚未落盘的会话数据写入文件"""
+        if self._sessionDirty:
+            self._saveSessionToFile()
 
     def isActive(self) -> bool:
         """检查会话是否活跃"""
@@ -176,17 +262,49 @@ class SessionManager(QObject):
         """获取访问令牌"""
         return self.accessToken
 
+    def getTokenTimeLeft(self) -> Optional[float]:
+        """获取访问令牌剩余有效时间（秒）
+
+        Returns:
+            剩余秒数；令牌不是带 exp 声明的 JWT 时返回 None
+        """
+        exp = self._decodeJwtExp(self.accessToken)
+        return None if exp is None else exp - time.time()
+
     def updateTokens(self, accessToken: str, refreshToken: str):
-        """更新令牌"""
+        """更新令牌（仅在主线程调用，会话文件和定时器不做跨线程保护）"""
         self.accessToken = accessToken
         self.refreshToken = refreshToken
+        self._verifyCache.clear()
+        if self.refreshTimer.isActive():
+            self._scheduleTokenCheck()
 
-        if self.sessionData:
-            self.sessionData['accessToken'] = accessToken
-            self.sessionData['refreshToken'] = refreshToken
+        if self.sessionData.get('rememberMe', False):
+            self._saveSessionToFile()
 
-            if self.sessionData.get('rememberMe', False):
-                self._saveSessionToFile()
+    @staticmethod
+    def _dumpsSession(sessionData: Dict[str, Any]) -> bytes:
+        """将会话数据序列化为紧凑的 UTF-8 JSON 字节串"""
+        if orjson is not None:
+            return orjson.dumps(sessionData, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(
+            sessionData, ensure_ascii=False, separators=(',', ':')
+        ).encode('utf-8')
+
+    @staticmethod
+    def _loadsSession(raw: bytes) -> Dict[str, Any]:
+        """解析会话文件内容（兼容旧版带缩进的格式）"""
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw)
+
+    def _toPersisted(self) -> Dict[str, Any]:
+        """构造写入会话文件的数据：会话数据加上当前令牌"""
+        return {
+            **self.sessionData,
+            'accessToken': self.accessToken,
+            'refreshToken': self.refreshToken
+        }
 
     def _saveSessionToFile(self):
         """保存会话到文件"""
@@ -194,16 +312,113 @@ class SessionManager(QObject):
             # 确保目录存在
             os.makedirs(os.path.dirname(self.sessionFile), exist_ok=True)
 
-            with open(self.sessionFile, 'w', encoding='utf-8') as f:
-                json.dump(self.sessionData, f, ensure_ascii=False, indent=2)
+            payload = self._dumpsSession(self._storeTokens(self._toPersisted()))
+            payloadHash = hashlib.blake2b(payload, digest_size=8).digest()
+            if payloadHash == self._lastWrittenHash:
+                self._sessionDirty = False
+                return
+
+            # 先写临时文件再原子替换，避免写入中途退出留下损坏的会话文件
+            tmpFile = self.sessionFile + '.tmp'
+            with open(tmpFile, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmpFile, self.sessionFile)
+            self._lastWrittenHash = payloadHash
+            self._sessionDirty = False
 
             self.logger.debug("会话已保存到文件")
 
         except Exception as e:
             self.logger.error(f"保存会话文件失败: {str(e)}")
 
+    @cached_property
+    def authClient(self) -> AuthClient:
+        """认证API客户端，首次请求服务器时才创建"""
+        return AuthClient()
+
+    @classmethod
+    def _getMachineKey(cls) -> bytes:
+        """获取由本机标识派生的密钥（每个进程只派生一次）"""
+        if cls._machineKey is None:
+            machineId = f"{platform.node()}-{uuid.getnode()}".encode('utf-8')
+            cls._machineKey = hashlib.pbkdf2_hmac(
+                'sha256', machineId, cls.KEYRING_SERVICE.encode('utf-8'), 100000
+            )
+        return cls._machineKey
+
+    def _tokenId(self, token: str) -> str:
+        """计算令牌的 HMAC-SHA256 指纹，作为令牌在密钥环中的键"""
+        return hmac.new(
+            self._getMachineKey(), token.encode('utf-8'), 'sha256'
+        ).hexdigest()[:16]
+
+    def _storeTokens(self, sessionData: Dict[str, Any]) -> Dict[str, Any]:
+        """将令牌移入系统密钥环，返回实际写入文件的会话数据
+
+        文件中只保留令牌指纹（accessTokenId / refreshTokenId）；
+        未安装 keyring 或密钥环不可用时原样返回，令牌仍保存在文件中。
+        """
+        if keyring is None:
+            return sessionData
+
+        storedData = dict(sessionData)
+        try:
+            for field in self.TOKEN_FIELDS:
+                token = storedData.pop(field, None)
+                if not token:
+                    continue
+                tokenId = self._tokenId(token)
+                oldId = self._keyringIds.get(field)
+                if tokenId != oldId:
+                    keyring.set_password(self.KEYRING_SERVICE, tokenId, token)
+                    self._keyringIds[field] = tokenId
+                    if oldId:
+                        self._deleteKeyringToken(oldId)
+                storedData[field + 'Id'] = tokenId
+        except Exception as e:
+            self.logger.warning(f"写入系统密钥环失败，令牌将保存在会话文件中: {str(e)}")
+            return sessionData
+
+        return storedData
+
+    def _loadTokens(self, sessionData: Dict[str, Any]) -> Dict[str, Any]:
+        """从系统密钥环取回会话文件中以指纹记录的令牌
+
+        取不到的令牌保持缺失，随后的会话数据验证会因此失败。
+        """
+        for field in self.TOKEN_FIELDS:
+            tokenId = sessionData.pop(field + 'Id', None)
+            if not tokenId or field in sessionData:
+                continue
+            self._keyringIds[field] = tokenId
+            if keyring is None:
+                continue
+            try:
+                token = keyring.get_password(self.KEYRING_SERVICE, tokenId)
+            except Exception as e:
+                self.logger.warning(f"读取系统密钥环失败: {str(e)}")
+                token = None
+            if token:
+                sessionData[field] = token
+        return sessionData
+
+    def _deleteKeyringToken(self, tokenId: str):
+        """从系统密钥环删除令牌"""
+        try:
+            keyring.delete_password(self.KEYRING_SERVICE, tokenId)
+        except Exception as e:
+            self.logger.debug(f"删除密钥环中的令牌失败: {str(e)}")
+
     def _clearSessionFile(self):
-        """清除会话文件"""
+        """清除会话文件（以及密钥环中对应的令牌）"""
+        if keyring is not None:
+            for tokenId in self._keyringIds.values():
+                self._deleteKeyringToken(tokenId)
+        self._keyringIds.clear()
+        self._lastWrittenHash = None
+
         try:
             if os.path.exists(self.sessionFile):
                 os.remove(self.sessionFile)
@@ -222,45 +437,90 @@ class SessionManager(QObject):
 
         # 检查会话是否过期（默认30天）
         try:
-            loginTime = datetime.fromisoformat(sessionData['loginTime'])
-            maxAge = timedelta(days=self.config.get('auth.session_max_age', 30))
+            loginTime = self._toTimestamp(sessionData['loginTime'])
+            sessionData['loginTime'] = loginTime
+            maxAge = self.config.get('auth.session_max_age', 30) * 86400
 
-            if datetime.now() - loginTime > maxAge:
+            if time.time() - loginTime > maxAge:
                 self.logger.info("会话已过期")
                 return False
 
-        except (ValueError, KeyError):
+        except (ValueError, TypeError, KeyError):
             return False
 
         return True
 
+    @staticmethod
+    def _toTimestamp(value) -> int:
+        """将会话中的时间转换为 Unix 时间戳
+
+        新会话直接保存时间戳；旧版会话文件中的 ISO 格式字符串在此转换。
+
+        Raises:
+            ValueError / TypeError: 时间格式无效时抛出
+        """
+        if isinstance(value, (int, float)):
+            return int(value)
+        return int(datetime.fromisoformat(value).timestamp())
+
     def _startTimers(self):
         """启动定时器"""
-        # 每5分钟检查一次令牌过期
-        self.refreshTimer.start(5 * 60 * 1000)
-
-        # 每小时验证一次会话
-        self.sessionTimer.start(60 * 60 * 1000)
+        self._scheduleTokenCheck()
+        self._scheduleSessionCheck()
+
+    def _startTimer(self, timer: QTimer, seconds: float):
+        """在指定秒数后触发单次定时器（已在计时时重新计时）"""
+        timer.start(min(int(seconds * 1000), self.MAX_TIMER_INTERVAL_MS))
+
+    def _scheduleTokenCheck(self):
+        """安排下一次令牌过期检查"""
+        timeLeft = self.getTokenTimeLeft()
+        if timeLeft is None:
+            delay = self.TOKEN_CHECK_INTERVAL
+        else:
+            delay = max(
+                timeLeft - self.config.get('auth.refresh_skew', 120),
+                self.MIN_TOKEN_CHECK_INTERVAL
+            )
+        self._startTimer(self.refreshTimer, delay)
+
+    def _scheduleSessionCheck(self):
+        """安排在无活动阈值到达时检查会话
+
+        活动时间更新时不重新计时：检查触发时按最新的活动时间重新安排。
+        """
+        now = time.time()
+        lastActivity = self._toTimestamp(self.sessionData.get('lastActivity', now))
+        self._startTimer(
+            self.sessionTimer, max(lastActivity + self.INACTIVE_THRESHOLD - now, 1)
+        )
 
     def _checkTokenExpiry(self):
-        """检查令牌过期"""
+        """检查令牌过期
+
+        只在本地判断，不发起网络请求：需要刷新时发出 tokenRefreshDue，
+        不透明令牌发出 tokenVerifyDue，由认证服务在线程池中完成请求；
+        新令牌经 updateTokens 应用后按其过期时间重新安排检查。
+        """
         if not self.accessToken:
             return
 
         try:
-            if not self._verifyTokenWithServer(self.accessToken):
-                self.logger.info("访问令牌即将过期或已过期")
-                # 尝试刷新令牌
-                if (self.refreshToken and
-                        self._refreshToken(self.refreshToken)):
-                    self.logger.info("令牌刷新成功")
-                else:
-                    self.logger.warning("令牌刷新失败，会话将过期")
-                    self.sessionExpired.emit()
+            # JWT 令牌直接读取 exp 判断，离过期还远时无需请求服务器；
+            # 无法解析的不透明令牌需要服务器验证
+            timeLeft = self.getTokenTimeLeft()
+            if timeLeft is None:
+                self.tokenVerifyDue.emit()
+            elif timeLeft <= self.config.get('auth.refresh_skew', 120):
+                self.logger.info("访问令牌即将过期或已过期，请求刷新")
+                self.tokenRefreshDue.emit()
 
         except Exception as e:
             self.logger.error(f"检查令牌过期失败: {str(e)}")
 
+        if self.accessToken:
+            self._scheduleTokenCheck()
+
     def _validateSession(self):
         """验证当前会话"""
         if not self.isActive():
@@ -268,20 +528,46 @@ class SessionManager(QObject):
 
         try:
             # 检查最后活动时间
-            lastActivity = datetime.fromisoformat(self.sessionData.get('lastActivity', datetime.now().isoformat()))
+            now = time.time()
+            lastActivity = self._toTimestamp(self.sessionData.get('lastActivity', now))
 
             # 如果超过2小时无活动，标记会话为不活跃
-            inactiveThreshold = timedelta(hours=2)
-            if datetime.now() - lastActivity > inactiveThreshold:
+            if now - lastActivity > self.INACTIVE_THRESHOLD:
                 self.logger.info("会话因长时间无活动而过期")
                 self.sessionExpired.emit()
                 self.endSession()
+                return
+
+            self._scheduleSessionCheck()
 
         except Exception as e:
             self.logger.error(f"验证会话失败: {str(e)}")
 
-    def _verifyTokenWithServer(self, token: str) -> bool:
-        """通过服务器验证令牌
+    @staticmethod
+    def _decodeJwtExp(token: Optional[str]) -> Optional[int]:
+        """在本地解析 JWT 的 exp 声明（不校验签名，仅用于判断刷新时机）
+
+        Args:
+            token: 访问令牌
+
+        Returns:
+            exp 时间戳；不是 JWT 或没有 exp 时返回 None
+        """
+        if not token or token.count('.') != 2:
+            return None
+
+        try:
+            payload = token.split('.')[1]
+            # base64url 去掉了填充，补齐后再解码
+            decoded = base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4))
+            exp = json.loads(decoded).get('exp')
+        except (binascii.Error, ValueError, AttributeError):
+            return None
+
+        return exp if isinstance(exp, (int, float)) else None
+
+    def verifyTokenWithServer(self, token: str) -> bool:
+        """通过服务器验证令牌（只读写以令牌摘要为键的验证缓存，可在线程池中调用）
 
         Args:
             token: 要验证的令牌
@@ -289,46 +575,142 @@ class SessionManager(QObject):
         Returns:
             验证结果
         """
-        try:
-            if not token:
-                return False
+        if not token:
+            return False
 
+        # 缓存键使用令牌摘要，不在缓存中保存令牌原文
+        cacheKey = hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+        cached = self._verifyCache.get(cacheKey)
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached[0]
+
+        try:
             # 使用AuthClient验证令牌
             authResponse = self.authClient.verifyToken(token)
-            return authResponse.success
+            isValid = authResponse.success
 
         except Exception as e:
             self.logger.error(f"服务器令牌验证失败: {str(e)}")
-            return False
+            isValid = False
+
+        if isValid:
+            ttl = self.config.get('auth.verify_cache_ttl', 60)
+            self._verifyCache[cacheKey] = (True, time.monotonic() + ttl)
+        else:
+            # 验证失败不缓存，下次仍向服务器确认
+            self._verifyCache.pop(cacheKey, None)
+
+        return isValid
+
+    def isRefreshing(self) -> bool:
+        """是否有令牌刷新请求正在进行"""
+        with self._refreshLock:
+            return self._refreshInFlight is not None
 
     def _refreshToken(self, refreshToken: str) -> bool:
-        """刷新访问令牌
+        """刷新访问令牌并更新会话（仅在主线程调用）
 
         Args:
             refreshToken: 刷新令牌
 
         Returns:
-            刷新是否成功
+            刷新是否成功；其他线程正在刷新时主线程不等待，返回 False
+        """
+        authResponse = self.fetchRefreshedTokens(refreshToken)
+        if authResponse is None:
+            return False
+
+        self.updateTokens(
+            authResponse.accessToken,
+            authResponse.refreshToken or refreshToken
+        )
+        return True
+
+    def fetchRefreshedTokens(self, refreshToken: str) -> Optional[AuthResponse]:
+        """向服务器请求新令牌，不修改会话状态，可在线程池中调用
+
+        自动刷新定时器与令牌过期检查可能同时触发刷新（可能位于不同线程），
+        此时只有第一个调用者真正发出请求，其余调用者复用它的结果。
+        主线程不等待其他线程的刷新结果，直接返回 None，以免界面卡住。
+        得到的新令牌需在主线程通过 applyRefreshedTokens 应用。
+
+        Args:
+            refreshToken: 刷新令牌
+
+        Returns:
+            刷新成功时的认证响应，失败时返回 None
+        """
+        with self._refreshLock:
+            inFlight = self._refreshInFlight
+            isOwner = inFlight is None
+            if isOwner:
+                inFlight = self._refreshInFlight = Future()
+
+        if not isOwner:
+            if threading.current_thread() is threading.main_thread():
+                self.logger.info("令牌刷新正在其他线程进行，主线程不等待")
+                return None
+            try:
+                return inFlight.result(timeout=self.REFRESH_WAIT_TIMEOUT)
+            except FutureTimeoutError:
+                self.logger.warning("等待令牌刷新结果超时")
+                return None
+
+        result = None
+        try:
+            result = self._requestTokenRefresh(refreshToken)
+        finally:
+            with self._refreshLock:
+                self._refreshInFlight = None
+            inFlight.set_result(result)
+        return result
+
+    def applyRefreshedTokens(self, refreshToken: str,
+                             authResponse: AuthResponse) -> bool:
+        """应用在其他线程取得的新令牌（仅在主线程调用）
+
+        刷新期间会话可能已经结束或换了令牌（登出、重新登录），
+        此时丢弃结果，避免把已结束的会话重新写回。
+
+        Args:
+            refreshToken: 发起刷新时使用的刷新令牌
+            authResponse: fetchRefreshedTokens 返回的认证响应
+
+        Returns:
+            是否已更新令牌
+        """
+        if not self.isActive() or self.refreshToken != refreshToken:
+            self.logger.info("会话在刷新期间已变化，丢弃刷新结果")
+            return False
+
+        self.updateTokens(
+            authResponse.accessToken,
+            authResponse.refreshToken or refreshToken
+        )
+        return True
+
+    def _requestTokenRefresh(self, refreshToken: str) -> Optional[AuthResponse]:
+        """向服务器请求新的访问令牌
+
+        Args:
+            refreshToken: 刷新令牌
+
+        Returns:
+            刷新成功时的认证响应，失败时返回 None
         """
         try:
-            # 设置刷新令牌并调用刷新API
-            self.authClient.refreshToken = refreshToken
-            authResponse = self.authClient.refreshAccessToken()
+            # 刷新令牌随调用传入，不修改共用客户端上保存的令牌
+            authResponse = self.authClient.refreshAccessToken(refreshToken)
 
             if authResponse.success and authResponse.accessToken:
-                # 更新令牌
-                self.updateTokens(
-                    authResponse.accessToken,
-                    authResponse.refreshToken or refreshToken
-                )
-                return True
+                return authResponse
             else:
                 self.logger.warning(f"令牌刷新失败: {authResponse.message}")
-                return False
+                return None
 
         except Exception as e:
             self.logger.error(f"刷新令牌失败: {str(e)}")
-            return False
+            return None
 
     def getRefreshToken(self) -> Optional[str]:
         """获取刷新令牌"""
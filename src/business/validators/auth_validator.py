@@ -4,21 +4,30 @@
 认证验证器 - 验证用户输入的认证相关数据
 """
 
-import re
+from functools import lru_cache
 from typing import Tuple
+from business.validators.patterns import EMAIL_PATTERN, LOGIN_USERNAME_PATTERN
 
 
 class AuthValidator:
-    """认证数据验证器"""
+    """认证数据验证器
 
-    def __init__(self):
-        # 邮箱正则表达式
-        self.emailPattern = re.compile(
-            r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        )
+    用户名、邮箱的校验只依赖输入字符串，结果按输入缓存：
+    表单在每次输入时重复校验相同的值，命中缓存后无需再次匹配正则。
+    （密码校验不做缓存，避免在内存中保留密码。）
+    """
+
+    # 所有状态都在类上，实例不需要 __dict__
+    __slots__ = ()
+
+    # 邮箱正则表达式
+    emailPattern = EMAIL_PATTERN
+
+    # 用户名正则表达式（3-20个字符，字母数字下划线）
+    usernamePattern = LOGIN_USERNAME_PATTERN
 
-        # 用户名正则表达式（3-20个字符，字母数字下划线）
-        self.usernamePattern = re.compile(r'^[a-zA-Z0-9_]{3,20}$')
+    # 每个校验方法缓存的输入数量
+    cacheSize = 1024
 
     def validateLoginInput(self, username: str, password: str) -> Tuple[bool, str]:
         """验证登录输入
@@ -30,19 +39,20 @@ class AuthValidator:
         Returns:
             Tuple[bool, str]: (是否有效, 错误信息)
         """
-        if not username or not username.strip():
+        # 只 strip 一次，空值与纯空白都视为未输入
+        username = username.strip() if username else ''
+        if not username:
             return False, '请输入用户名或邮箱'
 
         if not password or not password.strip():
             return False, '请输入密码'
 
-        username = username.strip()
-
         # 检查用户名长度
-        if len(username) < 3:
+        usernameLength = len(username)
+        if usernameLength < 3:
             return False, '用户名或邮箱长度不能少于3个字符'
 
-        if len(username) > 50:
+        if usernameLength > 50:
             return False, '用户名或邮箱长度不能超过50个字符'
 
         # 检查密码长度
@@ -87,7 +97,9 @@ class AuthValidator:
 
         return True, ''
 
-    def validateUsername(self, username: str) -> Tuple[bool, str]:
+    @classmethod
+    @lru_cache(maxsize=cacheSize)
+    def validateUsername(cls, username: str) -> Tuple[bool, str]:
         """验证用户名
 
         Args:
@@ -96,27 +108,29 @@ class AuthValidator:
         Returns:
             Tuple[bool, str]: (是否有效, 错误信息)
         """
-        if not username or not username.strip():
+        username = username.strip() if username else ''
+        if not username:
             return False, '请输入用户名'
 
-        username = username.strip()
-
-        if len(username) < 3:
+        usernameLength = len(username)
+        if usernameLength < 3:
             return False, '用户名长度不能少于3个字符'
 
-        if len(username) > 20:
+        if usernameLength > 20:
             return False, '用户名长度不能超过20个字符'
 
-        if not self.usernamePattern.match(username):
+        if not cls.usernamePattern.match(username):
             return False, '用户名只能包含字母、数字和下划线'
 
-        # 检查是否以数字开头
-        if username[0].isdigit():
+        # 检查是否以数字开头（上面的正则已保证是 ASCII 字符，直接比较范围）
+        if '0' <= username[0] <= '9':
             return False, '用户名不能以数字开头'
 
         return True, ''
 
-    def validateEmail(self, email: str) -> Tuple[bool, str]:
+    @classmethod
+    @lru_cache(maxsize=cacheSize)
+    def validateEmail(cls, email: str) -> Tuple[bool, str]:
         """验证邮箱
 
         Args:
@@ -125,15 +139,16 @@ class AuthValidator:
         Returns:
             Tuple[bool, str]: (是否有效, 错误信息)
         """
-        if not email or not email.strip():
+        email = email.strip() if email else ''
+        if not email:
             return False, '请输入邮箱地址'
 
-        email = email.strip().lower()
+        email = email.lower()
 
         if len(email) > 254:
             return False, '邮箱地址长度不能超过254个字符'
 
-        if not self.emailPattern.match(email):
+        if not cls.emailPattern.match(email):
             return False, '请输入有效的邮箱地址'
 
         return True, ''
@@ -157,10 +172,12 @@ class AuthValidator:
             return False, '密码长度不能超过128位'
 
         # 检查密码复杂度（至少包含字母和数字）
-        hasLetter = any(c.isalpha() for c in password)
-        hasDigit = any(c.isdigit() for c in password)
-
-        if not (hasLetter and hasDigit):
+        # 没有字母时无需再查找数字
+        hasLetterAndDigit = (
+            any(c.isalpha() for c in password) and
+            any(c.isdigit() for c in password)
+        )
+        if not hasLetterAndDigit:
             return False, '密码必须包含至少一个字母和一个数字'
 
         # 检查是否包含空格
@@ -198,7 +215,9 @@ class AuthValidator:
 
         return True, ''
 
-    def isEmail(self, text: str) -> bool:
+    @classmethod
+    @lru_cache(maxsize=cacheSize)
+    def isEmail(cls, text: str) -> bool:
         """检查文本是否为邮箱格式
 
         Args:
@@ -210,4 +229,4 @@ class AuthValidator:
         if not text:
             return False
 
-        return self.emailPattern.match(text.strip().lower()) is not None
+        return cls.emailPattern.match(text.strip().lower()) is not None
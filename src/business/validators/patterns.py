@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+验证器共用的正则表达式
+
+UserValidator 与 AuthValidator 使用相同的邮箱规则，统一在此编译，
+修改规则或替换匹配实现时只需改动一处。
+"""
+
+import re
+
+
+# 邮箱地址
+EMAIL_PATTERN = re.compile(
+    r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+)
+
+# 注册用户名：字母、数字、下划线和连字符（长度由 UserValidator 单独检查）
+USERNAME_PATTERN = re.compile(r'^[a-zA-Z0-9_-]+$')
+
+# 登录用户名：3-20个字母、数字或下划线
+LOGIN_USERNAME_PATTERN = re.compile(r'^[a-zA-Z0-9_]{3,20}$')
@@ -5,9 +5,9 @@
 提供用户数据的验证规则和业务逻辑检查
 """
 
-import re
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from business.models.user import User, LoginRequest, RegisterRequest
+from business.validators.patterns import EMAIL_PATTERN, USERNAME_PATTERN
 
 
 class ValidationError(Exception):
@@ -30,12 +30,33 @@ class UserValidator:
     maxUsernameLength = 30
     minPasswordLength = 8
     maxPasswordLength = 128
+    # 邮箱地址最大长度（RFC 5321），超长输入不再交给正则匹配
+    maxEmailLength = 254
 
     # 正则表达式模式
-    emailPattern = re.compile(
-        r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    )
-    usernamePattern = re.compile(r'^[a-zA-Z0-9_-]+$')
+    emailPattern = EMAIL_PATTERN
+    usernamePattern = USERNAME_PATTERN
+
+    # 密码允许的特殊字符
+    specialChars = frozenset('!@#$%^&*()_+-=[]{}|;:,.<>?')
+
+    @classmethod
+    def _passwordCharClasses(cls, password: str) -> Tuple[bool, bool, bool, bool]:
+        """判断密码包含哪些字符类别
+
+        先构造字符集合，再只对其中不重复的字符调用 str.isupper / islower /
+        isdigit（按 Unicode 字符属性判断），特殊字符与 specialChars 求交。
+
+        Returns:
+            (含大写字母, 含小写字母, 含数字, 含特殊字符)
+        """
+        chars = set(password)
+        return (
+            any(map(str.isupper, chars)),
+            any(map(str.islower, chars)),
+            any(map(str.isdigit, chars)),
+            not cls.specialChars.isdisjoint(chars)
+        )
 
     @classmethod
     def validateEmail(cls, email: str) -> bool:
@@ -49,7 +70,10 @@ class UserValidator:
         """
         if not email or not isinstance(email, str):
             return False
-        return bool(cls.emailPattern.match(email.strip()))
+        email = email.strip()
+        if len(email) > cls.maxEmailLength:
+            return False
+        return bool(cls.emailPattern.match(email))
 
     @classmethod
     def validateUsername(cls, username: str) -> bool:
@@ -76,6 +100,35 @@ class UserValidator:
         # 检查字符
         return bool(cls.usernamePattern.match(username))
 
+    @classmethod
+    def validateUsernamesBatch(cls, usernames: List[str]) -> List[bool]:
+        """批量验证用户名格式
+
+        结果与逐个调用 validateUsername 相同；长度范围和匹配函数只查找一次，
+        长度不合格的用户名不再进行正则匹配，适合批量导入用户时使用。
+
+        Args:
+            usernames: 用户名列表
+
+        Returns:
+            与输入一一对应的验证结果列表
+        """
+        minLength = cls.minUsernameLength
+        maxLength = cls.maxUsernameLength
+        match = cls.usernamePattern.match
+
+        results = []
+        for username in usernames:
+            if not username or not isinstance(username, str):
+                results.append(False)
+                continue
+            username = username.strip()
+            results.append(
+                minLength <= len(username) <= maxLength and
+                match(username) is not None
+            )
+        return results
+
     @classmethod
     def validatePassword(cls, password: str) -> bool:
         """验证密码强度
@@ -96,16 +149,8 @@ class UserValidator:
         if not lengthValid:
             return False
 
-        # 检查密码复杂度
-        hasUpper = any(c.isupper() for c in password)
-        hasLower = any(c.islower() for c in password)
-        hasDigit = any(c.isdigit() for c in password)
-        specialChars = '!@#$%^&*()_+-=[]{}|;:,.<>?'
-        hasSpecial = any(c in specialChars for c in password)
-
-        # 至少包含3种字符类型
-        complexityCount = sum([hasUpper, hasLower, hasDigit, hasSpecial])
-        return complexityCount >= 3
+        # 检查密码复杂度：至少包含3种字符类型
+        return sum(cls._passwordCharClasses(password)) >= 3
 
     @classmethod
     def validateUser(cls, user: User) -> List[str]:
@@ -250,10 +295,9 @@ class UserValidator:
             )
 
         # 字符类型检查
-        hasUpper = any(c.isupper() for c in password)
-        hasLower = any(c.islower() for c in password)
-        hasDigit = any(c.isdigit() for c in password)
-        hasSpecial = any(c in '!@#$%^&*()_+-=[]{}|;:,.<>?' for c in password)
+        hasUpper, hasLower, hasDigit, hasSpecial = (
+            cls._passwordCharClasses(password)
+        )
 
         if hasUpper:
             score += 20
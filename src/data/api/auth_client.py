@@ -9,8 +9,8 @@ import json
 import time
 from typing import Optional, Dict, Any, Tuple
 from urllib.parse import urljoin
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError, URLError
+import requests
+from data.api.network_client import session
 from infrastructure.config.app_config import AppConfig
 from infrastructure.logging.logger import getLogger
 from business.models.user import (
@@ -35,6 +35,12 @@ class AuthClient:
     提供用户认证相关的API调用功能
     """
 
+    # 默认请求头，所有请求共用，不在每次请求时重新构造
+    DEFAULT_HEADERS = {
+        'Content-Type': 'application/json',
+        'User-Agent': 'MyQt6App/1.0'
+    }
+
     def __init__(self, baseUrl: Optional[str] = None, timeout: int = 30,
                  maxRetries: int = 3, retryDelay: float = 1.0):
         """初始化认证客户端
@@ -84,19 +90,18 @@ class AuthClient:
         """
         url = urljoin(self.baseUrl, endpoint)
 
-        # 准备请求头
-        requestHeaders = {
-            'Content-Type': 'application/json',
-            'User-Agent': 'MyQt6App/1.0'
-        }
-
-        if headers:
-            requestHeaders.update(headers)
+        # 准备请求头，仅在需要附加字段时才复制默认请求头
+        requestHeaders = self.DEFAULT_HEADERS
+        addAuth = authRequired and self.sessionToken
+        if headers or addAuth:
+            requestHeaders = dict(self.DEFAULT_HEADERS)
+            if headers:
+                requestHeaders.update(headers)
 
-        # 添加认证头
-        if authRequired and self.sessionToken:
-            authHeader = f'Bearer {self.sessionToken}'
-            requestHeaders['Authorization'] = authHeader
+            # 添加认证头
+            if addAuth:
+                authHeader = f'Bearer {self.sessionToken}'
+                requestHeaders['Authorization'] = authHeader
 
         # 准备请求数据
         requestData = None
@@ -107,44 +112,48 @@ class AuthClient:
         lastException = None
         for attempt in range(self.maxRetries + 1):
             try:
-                # 创建请求
-                request = Request(
-                    url=url,
+                # 通过共享会话发送请求，复用 keep-alive 连接，
+                # 登录、注册等连续请求无需重复 TCP/TLS 握手
+                response = session.request(
+                    method,
+                    url,
                     data=requestData,
                     headers=requestHeaders,
-                    method=method
+                    timeout=self.timeout
                 )
+                statusCode = response.status_code
 
-                # 发送请求
-                with urlopen(request, timeout=self.timeout) as response:
-                    statusCode = response.getcode()
-                    responseData = json.loads(response.read().decode('utf-8'))
+                if statusCode >= 400:
+                    # HTTP错误不重试，直接处理
+                    try:
+                        errorData = response.json()
+                    except ValueError:
+                        errorData = {'message': f'HTTP {statusCode}'}
 
-                    self.logger.debug(
-                        f"API请求成功: {method} {url} -> {statusCode}"
+                    self.logger.error(
+                        f"API请求HTTP错误: {method} {url} -> {statusCode}: {errorData}"
                     )
 
-                    return statusCode, responseData
+                    errorMsg = errorData.get('message', f'HTTP {statusCode}')
+                    raise AuthAPIError(
+                        f"HTTP {statusCode}: {errorMsg}",
+                        statusCode=statusCode,
+                        responseData=errorData
+                    )
 
-            except HTTPError as httpError:
-                # HTTP错误不重试，直接处理
-                try:
-                    errorData = json.loads(httpError.read().decode('utf-8'))
-                except (json.JSONDecodeError, UnicodeDecodeError):
-                    errorData = {'message': str(httpError)}
+                responseData = response.json()
 
-                self.logger.error(
-                    f"API请求HTTP错误: {method} {url} -> {httpError.code}: {errorData}"
+                self.logger.debug(
+                    f"API请求成功: {method} {url} -> {statusCode}"
                 )
 
-                errorMsg = errorData.get('message', str(httpError))
-                raise AuthAPIError(
-                    f"HTTP {httpError.code}: {errorMsg}",
-                    statusCode=httpError.code,
-                    responseData=errorData
-                )
+                return statusCode, responseData
+
+            except AuthAPIError:
+                raise
 
-            except (URLError, ConnectionError, TimeoutError) as networkError:
+            except (requests.ConnectionError, requests.Timeout,
+                    ConnectionError, TimeoutError) as networkError:
                 lastException = networkError
                 if attempt < self.maxRetries:
                     self.logger.warning(
@@ -379,14 +388,21 @@ class AuthClient:
                 message=f"令牌验证过程发生错误: {verifyError}"
             )
 
-    def refreshAccessToken(self) -> AuthResponse:
+    def refreshAccessToken(self, refreshToken: Optional[str] = None) -> AuthResponse:
         """刷新访问令牌
 
+        Args:
+            refreshToken: 刷新令牌。传入时只使用该令牌、不修改客户端保存的令牌，
+                多个线程共用同一客户端时应显式传入；为None时使用当前保存的刷新令牌
+
         Returns:
             刷新结果
         """
         try:
-            if not self.refreshToken:
+            useStoredTokens = refreshToken is None
+            if useStoredTokens:
+                refreshToken = self.refreshToken
+            if not refreshToken:
                 return AuthResponse(
                     success=False,
                     message="没有刷新令牌"
@@ -396,7 +412,7 @@ class AuthClient:
 
             # 准备请求数据
             refreshData = {
-                'refreshToken': self.refreshToken
+                'refreshToken': refreshToken
             }
 
             # 发送刷新请求
@@ -406,18 +422,19 @@ class AuthClient:
 
             if statusCode == 200 and responseData.get('success'):
                 # 刷新成功
-                self.sessionToken = responseData.get('accessToken')
-                newRefreshToken = responseData.get('refreshToken')
-                if newRefreshToken:
-                    self.refreshToken = newRefreshToken
+                accessToken = responseData.get('accessToken')
+                refreshToken = responseData.get('refreshToken') or refreshToken
+                if useStoredTokens:
+                    self.sessionToken = accessToken
+                    self.refreshToken = refreshToken
 
                 self.logger.debug("访问令牌刷新成功")
 
                 return AuthResponse(
                     success=True,
                     message=responseData.get('message', '令牌刷新成功'),
-                    accessToken=self.sessionToken,
-                    refreshToken=self.refreshToken,
+                    accessToken=accessToken,
+                    refreshToken=refreshToken,
                     expiresIn=responseData.get('expiresIn')
                 )
             else:
@@ -440,14 +457,22 @@ class AuthClient:
                 message=f"令牌刷新过程发生错误: {refreshError}"
             )
 
-    def logout(self) -> AuthResponse:
+    def logout(self, sessionToken: Optional[str] = None) -> AuthResponse:
         """用户登出
 
+        Args:
+            sessionToken: 要注销的会话令牌。传入时不清除客户端保存的令牌，
+                避免在后台登出期间清掉重新登录后设置的新令牌；
+                为None时注销并清除当前保存的令牌
+
         Returns:
             登出结果
         """
+        useStoredTokens = sessionToken is None
         try:
-            if not self.sessionToken:
+            if useStoredTokens:
+                sessionToken = self.sessionToken
+            if not sessionToken:
                 return AuthResponse(
                     success=True,
                     message="已经处于登出状态"
@@ -458,7 +483,8 @@ class AuthClient:
             # 发送登出请求
             try:
                 statusCode, responseData = self._makeRequest(
-                    'POST', '/api/auth/logout', authRequired=True
+                    'POST', '/api/auth/logout',
+                    headers={'Authorization': f'Bearer {sessionToken}'}
                 )
 
                 message = responseData.get('message', '登出成功')
@@ -467,8 +493,9 @@ class AuthClient:
                 message = "登出成功（本地清除）"
 
             # 清除令牌
-            self.sessionToken = None
-            self.refreshToken = None
+            if useStoredTokens:
+                self.sessionToken = None
+                self.refreshToken = None
 
             self.logger.info("用户登出成功")
 
@@ -480,8 +507,9 @@ class AuthClient:
         except Exception as logoutError:
             self.logger.error(f"登出过程发生错误: {logoutError}")
             # 即使出错也清除本地令牌
-            self.sessionToken = None
-            self.refreshToken = None
+            if useStoredTokens:
+                self.sessionToken = None
+                self.refreshToken = None
 
             return AuthResponse(
                 success=True,
@@ -6,51 +6,84 @@
 
 import json
 import requests
-from PyQt6.QtCore import QThread, pyqtSignal
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
 
 
-class NetworkWorker(QThread):
-    """网络请求工作线程"""
+def createSession():
+    """创建带连接池的共享会话
+
+    所有请求都发往同一个 Worker 主机，复用 keep-alive 连接可以省去
+    每次点击都重新进行 TCP/TLS 握手的开销。网关暂时不可用（502/503/504）时，
+    幂等请求在连接池层面短暂退避后重试；连接错误由调用方自行重试。
+
+    Returns:
+        配置好的 requests.Session 实例
+    """
+    newSession = requests.Session()
+    retry = Retry(
+        total=2,
+        connect=0,
+        read=0,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retry)
+    newSession.mount('https://', adapter)
+    newSession.mount('http://', adapter)
+    newSession.headers.update({
+        'Content-Type': 'application/json',
+        'User-Agent': 'MyQt6App/1.0'
+    })
+    return newSession
+
+
+# 模块级共享会话
+session = createSession()
+
+
+class NetworkSignals(QObject):
+    """网络请求任务的信号（QRunnable 不是 QObject，不能直接定义信号）"""
     finished = pyqtSignal(dict)
     error = pyqtSignal(str)
 
+
+class NetworkWorker(QRunnable):
+    """网络请求任务，由 QThreadPool 中的线程执行"""
+
     def __init__(self, url, data, requestType='POST'):
         super().__init__()
         self.url = url
         self.data = data
         self.requestType = requestType
+        self.signals = NetworkSignals()
 
     def run(self):
         try:
-            headers = {'Content-Type': 'application/json'}
-
             if self.requestType == 'POST':
-                response = requests.post(
+                response = session.post(
                     self.url,
                     data=json.dumps(self.data),
-                    headers=headers,
                     timeout=10
                 )
             else:
-                response = requests.get(
-                    self.url,
-                    headers=headers,
-                    timeout=10
-                )
+                response = session.get(self.url, timeout=10)
 
             if response.status_code == 200:
                 result = response.json()
-                self.finished.emit(result)
+                self.signals.finished.emit(result)
             else:
                 errorData = response.json() if response.content else {}
                 errorMsg = errorData.get(
                     'error', f'HTTP {response.status_code}'
                 )
-                self.error.emit(errorMsg)
+                self.signals.error.emit(errorMsg)
 
         except requests.exceptions.RequestException as e:
-            self.error.emit(f'网络请求失败: {str(e)}')
+            self.signals.error.emit(f'网络请求失败: {str(e)}')
         except json.JSONDecodeError as e:
-            self.error.emit(f'响应解析失败: {str(e)}')
+            self.signals.error.emit(f'响应解析失败: {str(e)}')
         except Exception as e:
-            self.error.emit(f'未知错误: {str(e)}')
+            self.signals.error.emit(f'未知错误: {str(e)}')
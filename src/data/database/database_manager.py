@@ -5,11 +5,19 @@
 """
 
 import sqlite3
-from typing import List, Dict, Optional, Any
+import threading
+from typing import List, Dict, Optional, Any, Iterable
 
 
 class DatabaseManager:
-    """数据库管理器"""
+    """数据库管理器
+
+    整个进程共用一个长连接：sqlite3 按连接缓存已编译的语句，
+    重复执行的查询不必每次重新解析和生成执行计划。
+    """
+
+    # 每个连接缓存的已编译语句数量
+    STATEMENT_CACHE_SIZE = 128
 
     def __init__(self, dbPath: str = 'local_database.db'):
         """
@@ -20,20 +28,32 @@ class DatabaseManager:
         """
         self.dbPath = dbPath
         self.conn = None
+        # 连接可能被线程池中的任务共用，事务期间需要独占
+        self._lock = threading.RLock()
 
     def connect(self):
-        """连接到数据库"""
+        """连接到数据库（已连接时直接复用现有连接）"""
+        if self.conn is not None:
+            return
         try:
-            self.conn = sqlite3.connect(self.dbPath)
+            self.conn = sqlite3.connect(
+                self.dbPath,
+                check_same_thread=False,
+                cached_statements=self.STATEMENT_CACHE_SIZE
+            )
             self.conn.row_factory = sqlite3.Row
+            # WAL 模式下读写互不阻塞，NORMAL 同步级别只在检查点时 fsync
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
         except sqlite3.Error as e:
             print(f"数据库连接失败: {e}")
 
     def disconnect(self):
         """断开数据库连接"""
-        if self.conn:
-            self.conn.close()
-            self.conn = None
+        with self._lock:
+            if self.conn:
+                self.conn.close()
+                self.conn = None
 
     def executeQuery(self, query: str, params: tuple = ()) -> List[Dict[str, Any]]:
         """
@@ -46,17 +66,16 @@ class DatabaseManager:
         Returns:
             查询结果列表
         """
-        self.connect()
-        try:
-            cursor = self.conn.cursor()
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
-        except sqlite3.Error as e:
-            print(f"查询执行失败: {e}")
-            return []
-        finally:
-            self.disconnect()
+        with self._lock:
+            self.connect()
+            try:
+                cursor = self.conn.cursor()
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
+                return [dict(row) for row in rows]
+            except sqlite3.Error as e:
+                print(f"查询执行失败: {e}")
+                return []
 
     def executeUpdate(self, query: str, params: tuple = ()) -> Optional[int]:
         """
@@ -69,24 +88,65 @@ class DatabaseManager:
         Returns:
             返回最后插入的行ID
         """
-        self.connect()
-        try:
-            cursor = self.conn.cursor()
-            cursor.execute(query, params)
-            self.conn.commit()
-            return cursor.lastrowid
-        except sqlite3.Error as e:
-            print(f"更新执行失败: {e}")
-            self.conn.rollback()
-            return None
-        finally:
-            self.disconnect()
+        with self._lock:
+            self.connect()
+            try:
+                cursor = self.conn.cursor()
+                cursor.execute(query, params)
+                self.conn.commit()
+                return cursor.lastrowid
+            except sqlite3.Error as e:
+                print(f"更新执行失败: {e}")
+                self.conn.rollback()
+                return None
+
+    def executeBatch(self, query: str,
+                     paramsList: Iterable[tuple]) -> Optional[List[int]]:
+        """
+        在同一个事务中批量执行更新操作
+
+        与逐条调用 executeUpdate 相比只提交一次，
+        开始/提交事务的开销由整批操作分摊；任一条失败时整批回滚。
+
+        Args:
+            query: SQL更新语句
+            paramsList: 每条语句的参数
+
+        Returns:
+            每条语句对应的最后插入行ID列表，失败时返回None
+        """
+        with self._lock:
+            self.connect()
+            try:
+                cursor = self.conn.cursor()
+                rowIds = []
+                for params in paramsList:
+                    cursor.execute(query, params)
+                    rowIds.append(cursor.lastrowid)
+                self.conn.commit()
+                return rowIds
+            except sqlite3.Error as e:
+                print(f"批量更新执行失败: {e}")
+                self.conn.rollback()
+                return None
 
     def addUser(self, username: str, email: str, passwordHash: str) -> Optional[int]:
         """添加新用户"""
         query = "INSERT INTO users (username, email, passwordHash) VALUES (?, ?, ?)"
         return self.executeUpdate(query, (username, email, passwordHash))
 
+    def addUsers(self, users: Iterable[tuple]) -> Optional[List[int]]:
+        """在一个事务中批量添加用户
+
+        Args:
+            users: (username, email, passwordHash) 元组序列
+
+        Returns:
+            新用户ID列表，失败时返回None（不会写入任何用户）
+        """
+        query = "INSERT INTO users (username, email, passwordHash) VALUES (?, ?, ?)"
+        return self.executeBatch(query, users)
+
     def getUserById(self, userId: int) -> Optional[Dict[str, Any]]:
         """根据ID获取用户"""
         query = "SELECT * FROM users WHERE id = ?"
@@ -110,11 +170,20 @@ class DatabaseManager:
         query = "SELECT * FROM users"
         return self.executeQuery(query)
 
-    def searchUsers(self, keyword: str) -> List[Dict[str, Any]]:
-        """搜索用户"""
-        query = "SELECT * FROM users WHERE username LIKE ? OR email LIKE ?"
+    def searchUsers(self, keyword: str,
+                    limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """搜索用户
+
+        Args:
+            keyword: 搜索关键词
+            limit: 最多返回的用户数，None 表示不限制
+        """
         param = f"%{keyword}%"
-        return self.executeQuery(query, (param, param))
+        if limit is None:
+            query = "SELECT * FROM users WHERE username LIKE ? OR email LIKE ?"
+            return self.executeQuery(query, (param, param))
+        query = "SELECT * FROM users WHERE username LIKE ? OR email LIKE ? LIMIT ?"
+        return self.executeQuery(query, (param, param, limit))
 
     def updateUser(self, userId: int, username: str, email: str) -> bool:
         """更新用户信息"""
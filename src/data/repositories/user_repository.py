@@ -41,6 +41,37 @@ class UserRepository:
             print(f"创建用户失败: {createError}")
             return None
 
+    def createMany(self, users: List[User]) -> List[User]:
+        """批量创建用户
+
+        所有用户在同一个数据库事务中写入，要么全部成功，要么全部失败。
+
+        Args:
+            users: 用户对象列表
+
+        Returns:
+            List[User]: 创建成功的用户列表，失败返回空列表
+        """
+        if not users:
+            return []
+
+        try:
+            userIds = self.databaseManager.addUsers([
+                (user.username, user.email, user.passwordHash)
+                for user in users
+            ])
+
+            if not userIds:
+                return []
+
+            for user, userId in zip(users, userIds):
+                user.id = userId
+            return users
+
+        except Exception as createManyError:
+            print(f"批量创建用户失败: {createManyError}")
+            return []
+
     def getById(self, userId: int) -> Optional[User]:
         """根据ID获取用户
 
@@ -106,24 +137,25 @@ class UserRepository:
         """
         try:
             usersData = self.databaseManager.getAllUsers()
-            return [User.fromDict(userData) for userData in usersData]
+            return User.fromDictList(usersData)
 
         except Exception as getAllError:
             print(f"获取用户列表失败: {getAllError}")
             return []
 
-    def search(self, keyword: str) -> List[User]:
+    def search(self, keyword: str, limit: Optional[int] = None) -> List[User]:
         """搜索用户
 
         Args:
             keyword: 搜索关键词
+            limit: 最多返回的用户数，None 表示不限制
 
         Returns:
             List[User]: 匹配的用户列表
         """
         try:
-            usersData = self.databaseManager.searchUsers(keyword)
-            return [User.fromDict(userData) for userData in usersData]
+            usersData = self.databaseManager.searchUsers(keyword, limit)
+            return User.fromDictList(usersData)
 
         except Exception as searchError:
             print(f"搜索用户失败: {searchError}")
@@ -105,8 +105,19 @@ class PasswordHelper:
 class ValidationHelper:
     """数据验证工具"""
 
-    @staticmethod
-    def isValidEmail(email: str) -> bool:
+    # 正则表达式模式（类加载时编译一次）
+    emailPattern = re.compile(
+        r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+    )
+    # 用户名只能包含字母、数字、下划线，长度3-20
+    usernamePattern = re.compile(r'^[a-zA-Z0-9_]{3,20}$')
+    uppercasePattern = re.compile(r'[A-Z]')
+    lowercasePattern = re.compile(r'[a-z]')
+    digitPattern = re.compile(r'\d')
+    symbolPattern = re.compile(r'[!@#$%^&*()_+\-=\[\]{}|;:,.<>?]')
+
+    @classmethod
+    def isValidEmail(cls, email: str) -> bool:
         """验证邮箱格式
 
         Args:
@@ -115,11 +126,10 @@ class ValidationHelper:
         Returns:
             bool: 邮箱格式是否有效
         """
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        return cls.emailPattern.match(email) is not None
 
-    @staticmethod
-    def isValidUsername(username: str) -> bool:
+    @classmethod
+    def isValidUsername(cls, username: str) -> bool:
         """验证用户名格式
 
         Args:
@@ -128,12 +138,10 @@ class ValidationHelper:
         Returns:
             bool: 用户名格式是否有效
         """
-        # 用户名只能包含字母、数字、下划线，长度3-20
-        pattern = r'^[a-zA-Z0-9_]{3,20}$'
-        return re.match(pattern, username) is not None
+        return cls.usernamePattern.match(username) is not None
 
-    @staticmethod
-    def isStrongPassword(password: str) -> Dict[str, bool]:
+    @classmethod
+    def isStrongPassword(cls, password: str) -> Dict[str, bool]:
         """检查密码强度
 
         Args:
@@ -144,12 +152,10 @@ class ValidationHelper:
         """
         return {
             'lengthOk': len(password) >= 8,
-            'hasUppercase': bool(re.search(r'[A-Z]', password)),
-            'hasLowercase': bool(re.search(r'[a-z]', password)),
-            'hasNumbers': bool(re.search(r'\d', password)),
-            'hasSymbols': bool(
-                re.search(r'[!@#$%^&*()_+\-=\[\]{}|;:,.<>?]', password)
-            )
+            'hasUppercase': bool(cls.uppercasePattern.search(password)),
+            'hasLowercase': bool(cls.lowercasePattern.search(password)),
+            'hasNumbers': bool(cls.digitPattern.search(password)),
+            'hasSymbols': bool(cls.symbolPattern.search(password))
         }
 
     @staticmethod
@@ -327,6 +333,10 @@ class FileHelper:
 class StringHelper:
     """字符串工具"""
 
+    # 驼峰转蛇形使用的正则表达式模式
+    wordStartPattern = re.compile('(.)([A-Z][a-z]+)')
+    caseBoundaryPattern = re.compile('([a-z0-9])([A-Z])')
+
     @staticmethod
     def truncate(text: str, maxLength: int, suffix: str = '...') -> str:
         """截断字符串
@@ -344,8 +354,8 @@ class StringHelper:
 
         return text[:maxLength - len(suffix)] + suffix
 
-    @staticmethod
-    def toSnakeCase(text: str) -> str:
+    @classmethod
+    def toSnakeCase(cls, text: str) -> str:
         """转换为蛇形命名
 
         Args:
@@ -355,9 +365,9 @@ class StringHelper:
             str: 蛇形命名字符串
         """
         # 在大写字母前插入下划线
-        firstStep = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', text)
+        firstStep = cls.wordStartPattern.sub(r'\1_\2', text)
         # 在小写字母和大写字母之间插入下划线
-        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', firstStep).lower()
+        return cls.caseBoundaryPattern.sub(r'\1_\2', firstStep).lower()
 
     @staticmethod
     def toCamelCase(text: str) -> str:
@@ -4,6 +4,7 @@
 应用主入口 - 重构后的分层架构应用
 """
 
+import os
 import sys
 import argparse
 from pathlib import Path
@@ -36,6 +37,20 @@ def setupApplication():
         应用程序实例
     """
     qApplication, qTranslator, qLocale, config, _, _, _ = getImports()
+    from PyQt6.QtCore import Qt, QThreadPool
+
+    # 关闭用不到的 Qt 特性，减少启动开销
+    qApplication.setAttribute(
+        Qt.ApplicationAttribute.AA_DontCreateNativeWidgetSiblings, True
+    )
+    qApplication.setAttribute(
+        Qt.ApplicationAttribute.AA_CompressHighFrequencyEvents, True
+    )
+    # 无显示环境（CI / offscreen）下使用软件 OpenGL，避免初始化 GLX
+    if os.environ.get('CI') or os.environ.get('QT_QPA_PLATFORM') == 'offscreen':
+        qApplication.setAttribute(
+            Qt.ApplicationAttribute.AA_UseSoftwareOpenGL, True
+        )
 
     app = qApplication(sys.argv)
 
@@ -45,6 +60,9 @@ def setupApplication():
     app.setOrganizationName("MyQt6App")
     app.setOrganizationDomain("myqt6app.com")
 
+    # 网络请求统一提交到全局线程池，限制并发线程数
+    QThreadPool.globalInstance().setMaxThreadCount(4)
+
     # 设置国际化
     translator = qTranslator()
     locale = qLocale(config.get('ui.language', 'zh_CN'))
@@ -111,7 +129,6 @@ def main():
 
         # 如果指定了配置文件，设置环境变量
         if args.config:
-            import os
             os.environ['APP_CONFIG_PATH'] = args.config
             config.reload()
 
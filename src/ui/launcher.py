@@ -54,9 +54,9 @@ class AppLauncher(QObject):
         self.logger = getLogger(self.__class__.__name__)
         self.currentWindow: Optional[QObject] = None
 
-        # 初始化认证服务
+        # 初始化认证服务（_smartLaunch 中会主动恢复会话，无需自动登录）
         self.configManager = AppConfig()
-        self.authService = AuthService(self.configManager)
+        self.authService = AuthService(self.configManager, autoLogin=False)
 
         # 连接认证信号
         self._connectAuthSignals()
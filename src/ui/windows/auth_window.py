@@ -4,7 +4,7 @@
 用户认证窗口 - 集成登录和注册功能
 """
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThreadPool
 from PyQt6.QtWidgets import QWidget, QVBoxLayout
 from qfluentwidgets import (
     TitleLabel, LineEdit, PasswordLineEdit,
@@ -18,6 +18,9 @@ from data.api.network_client import NetworkWorker
 class AuthWindow(QWidget):
     """用户认证窗口 - 包含登录和注册功能"""
 
+    # 选项卡路由键与堆叠页面索引的对应关系
+    ROUTE_INDEX = {'login': 0, 'register': 1}
+
     def __init__(self):
         super().__init__()
         self.initUi()
@@ -43,16 +46,9 @@ class AuthWindow(QWidget):
 
         # 创建选项卡
         self.pivot = Pivot()
-        self.pivot.addItem(
-            routeKey='login',
-            text='登录',
-            onClick=lambda: self.stackedWidget.setCurrentIndex(0)
-        )
-        self.pivot.addItem(
-            routeKey='register',
-            text='注册',
-            onClick=lambda: self.stackedWidget.setCurrentIndex(1)
-        )
+        self.pivot.addItem(routeKey='login', text='登录')
+        self.pivot.addItem(routeKey='register', text='注册')
+        self.pivot.currentItemChanged.connect(self.onRouteChanged)
         layout.addWidget(self.pivot)
 
         # 创建堆叠窗口
@@ -71,9 +67,14 @@ class AuthWindow(QWidget):
 
         self.setLayout(layout)
 
-        # 设置默认页面
+        # 设置默认页面（第一个加入的页面已是当前页，只需同步选项卡）
         self.pivot.setCurrentItem('login')
-        self.stackedWidget.setCurrentIndex(0)
+
+    def onRouteChanged(self, routeKey):
+        """根据选项卡路由键切换页面，已在目标页时不做任何事"""
+        index = self.ROUTE_INDEX[routeKey]
+        if self.stackedWidget.currentIndex() != index:
+            self.stackedWidget.setCurrentIndex(index)
 
     def createLoginWidget(self):
         """创建登录页面"""
@@ -188,8 +189,8 @@ class AuthWindow(QWidget):
         self.loginButton.setEnabled(False)
         self.loginButton.setText('登录中...')
 
-        # 创建网络请求线程
-        self.loginWorker = NetworkWorker(
+        # 创建网络请求任务
+        loginWorker = NetworkWorker(
             'https://pw.yangxz.top/login',
             {
                 'username': username,
@@ -198,11 +199,11 @@ class AuthWindow(QWidget):
         )
 
         # 连接信号
-        self.loginWorker.finished.connect(self.onLoginSuccess)
-        self.loginWorker.error.connect(self.onLoginError)
+        loginWorker.signals.finished.connect(self.onLoginSuccess)
+        loginWorker.signals.error.connect(self.onLoginError)
 
-        # 启动线程
-        self.loginWorker.start()
+        # 提交到全局线程池，任务生命周期由线程池管理
+        QThreadPool.globalInstance().start(loginWorker)
 
     def onRegister(self):
         """处理注册"""
@@ -244,8 +245,8 @@ class AuthWindow(QWidget):
         self.registerButton.setEnabled(False)
         self.registerButton.setText('注册中...')
 
-        # 创建网络请求线程
-        self.registerWorker = NetworkWorker(
+        # 创建网络请求任务
+        registerWorker = NetworkWorker(
             'https://pw.yangxz.top/register',
             {
                 'username': username,
@@ -255,11 +256,11 @@ class AuthWindow(QWidget):
         )
 
         # 连接信号
-        self.registerWorker.finished.connect(self.onRegisterSuccess)
-        self.registerWorker.error.connect(self.onRegisterError)
+        registerWorker.signals.finished.connect(self.onRegisterSuccess)
+        registerWorker.signals.error.connect(self.onRegisterError)
 
-        # 启动线程
-        self.registerWorker.start()
+        # 提交到全局线程池，任务生命周期由线程池管理
+        QThreadPool.globalInstance().start(registerWorker)
 
     def onLoginSuccess(self, result):
         """登录成功处理"""
@@ -311,9 +312,8 @@ class AuthWindow(QWidget):
         self.registerPasswordInput.clear()
         self.registerConfirmPasswordInput.clear()
 
-        # 切换到登录页面
+        # 切换到登录页面（由 onRouteChanged 同步堆叠页面）
         self.pivot.setCurrentItem('login')
-        self.stackedWidget.setCurrentIndex(0)
 
     def onRegisterError(self, errorMsg):
         """注册失败处理"""
@@ -4,9 +4,8 @@
 登录窗口
 """
 
-import asyncio
 from typing import Optional
-from PyQt6.QtCore import Qt, pyqtSignal, QThread, pyqtSlot
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout
 from qfluentwidgets import (
     TitleLabel, LineEdit, PasswordLineEdit,
@@ -19,27 +18,6 @@ from infrastructure.config.app_config import AppConfig
 from infrastructure.logging.logger import getLogger
 
 
-class AsyncWorker(QThread):
-    """异步工作线程"""
-    finished = pyqtSignal(bool)
-    error = pyqtSignal(str)
-
-    def __init__(self, coro):
-        super().__init__()
-        self.coro = coro
-
-    def run(self):
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(self.coro)
-            self.finished.emit(result)
-        except Exception as e:
-            self.error.emit(str(e))
-        finally:
-            loop.close()
-
-
 class LoginWindow(QWidget):
     """登录窗口"""
 
@@ -52,10 +30,8 @@ class LoginWindow(QWidget):
         super().__init__()
         self.config = config_manager or AppConfig()
         self.logger = getLogger(__name__)
-        self.authService = AuthService(self.config)
-
-        # 工作线程
-        self.worker: Optional[AsyncWorker] = None
+        # 会话恢复由启动器负责，登录窗口不自动登录
+        self.authService = AuthService(self.config, autoLogin=False)
 
         self.initUi()
         self.connectAuthSignals()
@@ -188,10 +164,9 @@ class LoginWindow(QWidget):
         # 设置加载状态
         self.setLoading(True)
 
-        # 直接调用登录方法
+        # 登录请求在后台线程执行，结果通过 loginSuccess / loginFailed 信号返回
         try:
-            success = self.authService.login(username, password, remember)
-            self.onWorkerFinished(success)
+            self.authService.login(username, password, remember)
         except Exception as e:
             self.onWorkerError(str(e))
 
@@ -211,6 +186,8 @@ class LoginWindow(QWidget):
     @pyqtSlot(dict)
     def onAuthSuccess(self, result: dict):
         """认证成功处理"""
+        self.onWorkerFinished(True)
+
         user = result.get('user', {})
         username = user.get('username', '用户')
 
@@ -233,6 +210,7 @@ class LoginWindow(QWidget):
     @pyqtSlot(str)
     def onAuthFailed(self, error: str):
         """认证失败处理"""
+        self.setLoading(False)
         self.logger.warning(f"登录失败: {error}")
         self.showError(error)
 
@@ -299,7 +277,7 @@ class LoginWindow(QWidget):
                 return
 
             # 调用忘记密码服务
-            self.authService.forgot_password(email)
+            self.authService.forgotPassword(email)
             dialog.close()
 
         dialog.yesButton.clicked.connect(onConfirm)
@@ -4,15 +4,16 @@
 主窗口 - 集成所有功能的菜单式应用
 """
 
-import sys
-import subprocess
+import importlib.util
+import io
 import os
-from PyQt6.QtCore import Qt
+from functools import lru_cache
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, QUrl, pyqtSignal
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QMessageBox, QLabel
 )
-from PyQt6.QtGui import QAction, QFont
+from PyQt6.QtGui import QAction, QDesktopServices, QFont
 from qfluentwidgets import (
     setTheme, Theme, TitleLabel, PrimaryPushButton, PushButton
 )
@@ -20,6 +21,48 @@ from qfluentwidgets import (
 from ui.components.settings import SettingsWidget
 
 
+# 项目根目录
+projectRoot = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+
+@lru_cache(maxsize=None)
+def loadViewUsersMain():
+    """加载 scripts/view_users.py 的入口函数（仅首次调用时导入）"""
+    scriptPath = os.path.join(projectRoot, "scripts", "view_users.py")
+    spec = importlib.util.spec_from_file_location("view_users", scriptPath)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.main
+
+
+class ScriptSignals(QObject):
+    """脚本任务信号"""
+    finished = pyqtSignal(str)
+    error = pyqtSignal(str)
+
+
+class ScriptTask(QRunnable):
+    """在线程池中运行脚本入口函数，并收集其输出
+
+    入口函数需接受 out 关键字参数，输出写入该流。
+    """
+
+    def __init__(self, func, *args):
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.signals = ScriptSignals()
+
+    def run(self):
+        # 每个任务使用独立的缓冲区，不重定向进程级的 sys.stdout
+        output = io.StringIO()
+        try:
+            self.func(*self.args, out=output)
+            self.signals.finished.emit(output.getvalue())
+        except (Exception, SystemExit) as e:
+            self.signals.error.emit(output.getvalue() or str(e))
+
+
 class MainWindow(QMainWindow):
     """主应用程序窗口"""
 
@@ -228,17 +271,15 @@ class MainWindow(QMainWindow):
     def viewRemoteDatabase(self):
         """查看远程数据库"""
         try:
-            result = subprocess.run(
-                [sys.executable, "scripts/view_users.py", "remote"],
-                capture_output=True,
-                text=True,
-                cwd=os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+            # 在当前进程的线程池中运行脚本，避免启动新的 Python 解释器
+            task = ScriptTask(loadViewUsersMain(), "remote")
+            task.signals.finished.connect(
+                lambda output: QMessageBox.information(self, "远程数据库信息", output)
             )
-
-            if result.returncode == 0:
-                QMessageBox.information(self, "远程数据库信息", result.stdout)
-            else:
-                QMessageBox.warning(self, "错误", f"查看失败：{result.stderr}")
+            task.signals.error.connect(
+                lambda error: QMessageBox.warning(self, "错误", f"查看失败：{error}")
+            )
+            QThreadPool.globalInstance().start(task)
         except Exception as e:
             QMessageBox.critical(self, "错误", f"无法查看远程数据库：{str(e)}")
 
@@ -274,32 +315,16 @@ class MainWindow(QMainWindow):
     def openScriptsDirectory(self):
         """打开脚本目录"""
         try:
-            scriptsPath = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                "scripts"
-            )
-            if sys.platform == "darwin":  # macOS
-                subprocess.run(["open", scriptsPath])
-            elif sys.platform == "win32":  # Windows
-                subprocess.run(["explorer", scriptsPath])
-            else:  # Linux
-                subprocess.run(["xdg-open", scriptsPath])
+            scriptsPath = os.path.join(projectRoot, "scripts")
+            QDesktopServices.openUrl(QUrl.fromLocalFile(scriptsPath))
         except Exception as e:
             QMessageBox.critical(self, "错误", f"无法打开脚本目录：{str(e)}")
 
     def openDocsDirectory(self):
         """打开文档目录"""
         try:
-            docsPath = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                "docs"
-            )
-            if sys.platform == "darwin":  # macOS
-                subprocess.run(["open", docsPath])
-            elif sys.platform == "win32":  # Windows
-                subprocess.run(["explorer", docsPath])
-            else:  # Linux
-                subprocess.run(["xdg-open", docsPath])
+            docsPath = os.path.join(projectRoot, "docs")
+            QDesktopServices.openUrl(QUrl.fromLocalFile(docsPath))
         except Exception as e:
             QMessageBox.critical(self, "错误", f"无法打开文档目录：{str(e)}")
 
@@ -28,8 +28,8 @@ class RegisterWindow(QWidget):
     def __init__(self):
         super().__init__()
 
-        # 初始化服务
-        self.authService = AuthService()
+        # 初始化服务（会话恢复由启动器负责，注册窗口不自动登录）
+        self.authService = AuthService(autoLogin=False)
         self.config = AppConfig()
         self.logger = getLogger(__name__)
 
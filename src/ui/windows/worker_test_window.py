@@ -4,7 +4,7 @@
 Worker测试窗口 - 用于测试Cloudflare Worker API
 """
 
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout
 from qfluentwidgets import (
     TitleLabel, LineEdit, TextEdit, PrimaryPushButton,
@@ -14,66 +14,73 @@ from qfluentwidgets import (
 import json
 import requests
 
+from data.api.network_client import session
 
-class WorkerRequestThread(QThread):
-    """Worker请求线程"""
+
+class WorkerRequestSignals(QObject):
+    """Worker请求任务的信号"""
     finished = pyqtSignal(dict)
     error = pyqtSignal(str)
 
+
+class WorkerRequestTask(QRunnable):
+    """Worker请求任务，由 QThreadPool 中的线程执行"""
+
     def __init__(self, url, method='GET', data=None):
         super().__init__()
         self.url = url
         self.method = method
         self.data = data
+        self.signals = WorkerRequestSignals()
 
     def run(self):
         try:
-            headers = {'Content-Type': 'application/json'}
-
             if self.method == 'GET':
-                response = requests.get(self.url, headers=headers, timeout=10)
+                response = session.get(self.url, timeout=10)
             elif self.method == 'POST':
-                response = requests.post(
+                response = session.post(
                     self.url,
                     data=json.dumps(self.data) if self.data else None,
-                    headers=headers,
                     timeout=10
                 )
             elif self.method == 'PUT':
-                response = requests.put(
+                response = session.put(
                     self.url,
                     data=json.dumps(self.data) if self.data else None,
-                    headers=headers,
                     timeout=10
                 )
             elif self.method == 'DELETE':
-                response = requests.delete(
+                response = session.delete(
                     self.url,
-                    headers=headers,
                     timeout=10
                 )
             else:
-                self.error.emit(f'不支持的HTTP方法: {self.method}')
+                self.signals.error.emit(f'不支持的HTTP方法: {self.method}')
                 return
 
+            # 直接从原始字节解析JSON，不先解码成文本再解析
+            try:
+                parsedJson = json.loads(response.content)
+            except ValueError:
+                parsedJson = None
+
             result = {
                 'status_code': response.status_code,
                 'headers': dict(response.headers),
-                'content': response.text
+                # 在工作线程中完成格式化，界面线程只负责拼接显示
+                'jsonText': json.dumps(
+                    parsedJson, indent=2, ensure_ascii=False
+                ) if parsedJson else None,
+                # 界面只在没有JSON内容时才显示原始文本，避免重复保留一份响应体
+                'content': '' if parsedJson else response.text
             }
 
-            # 尝试解析JSON响应
-            try:
-                result['json'] = response.json()
-            except json.JSONDecodeError:
-                result['json'] = None
-
-            self.finished.emit(result)
+            self.signals.finished.emit(result)
 
         except requests.exceptions.RequestException as e:
-            self.error.emit(f'请求失败: {str(e)}')
+            self.signals.error.emit(f'请求失败: {str(e)}')
         except Exception as e:
-            self.error.emit(f'未知错误: {str(e)}')
+            self.signals.error.emit(f'未知错误: {str(e)}')
 
 
 class WorkerTestWindow(QWidget):
@@ -198,15 +205,15 @@ class WorkerTestWindow(QWidget):
         # 清空响应显示
         self.responseDisplay.clear()
 
-        # 创建请求线程
-        self.worker = WorkerRequestThread(url, method, requestData)
+        # 创建请求任务
+        task = WorkerRequestTask(url, method, requestData)
 
         # 连接信号
-        self.worker.finished.connect(self.onRequestFinished)
-        self.worker.error.connect(self.onRequestError)
+        task.signals.finished.connect(self.onRequestFinished)
+        task.signals.error.connect(self.onRequestError)
 
-        # 启动线程
-        self.worker.start()
+        # 提交到全局线程池，任务生命周期由线程池管理
+        QThreadPool.globalInstance().start(task)
 
     def onRequestFinished(self, result):
         """请求完成处理"""
@@ -224,13 +231,9 @@ class WorkerTestWindow(QWidget):
 
         # 显示响应内容
         responseText += "响应内容:\n"
-        if result['json']:
-            # 格式化JSON响应
-            responseText += json.dumps(
-                result['json'],
-                indent=2,
-                ensure_ascii=False
-            )
+        if result['jsonText']:
+            # 已格式化的JSON响应
+            responseText += result['jsonText']
         else:
             responseText += result['content']
 
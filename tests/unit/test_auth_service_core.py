@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+认证服务核心逻辑单元测试
+
+测试登录、注册请求的构造与校验（不依赖 Qt）
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+
+# 添加src目录到Python路径
+src_path = Path(__file__).parent.parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from business.models.user import RegisterRequest  # noqa: E402
+from business.services.auth_service_core import (  # noqa: E402
+    buildLoginRequest, checkLoginRequest, checkRegisterRequest, joinErrors
+)
+
+
+class TestAuthServiceCore:
+    """认证服务核心逻辑测试类"""
+
+    @pytest.mark.unit
+    def testBuildLoginRequest(self):
+        """测试创建登录请求"""
+        request = buildLoginRequest("testUser", "secret", remember=True)
+
+        assert request.username == "testUser"
+        assert request.password == "secret"
+        assert request.rememberMe is True
+
+    @pytest.mark.unit
+    def testCheckLoginRequest(self):
+        """测试登录请求校验"""
+        assert checkLoginRequest(buildLoginRequest("testUser", "secret")) is None
+
+        errorMsg = checkLoginRequest(buildLoginRequest("", ""))
+        assert errorMsg == "用户名不能为空; 密码不能为空"
+
+    @pytest.mark.unit
+    def testCheckRegisterRequest(self):
+        """测试注册请求校验"""
+        validRequest = RegisterRequest(
+            username="testUser",
+            email="test@example.com",
+            password="Password123",
+            confirmPassword="Password123"
+        )
+        assert checkRegisterRequest(validRequest) is None
+
+        mismatchRequest = RegisterRequest(
+            username="testUser",
+            email="test@example.com",
+            password="Password123",
+            confirmPassword="Password321"
+        )
+        assert checkRegisterRequest(mismatchRequest) == "两次输入的密码不一致"
+
+    @pytest.mark.unit
+    def testJoinErrors(self):
+        """测试错误信息合并"""
+        assert joinErrors([]) is None
+        assert joinErrors(["a", "b"]) == "a; b"
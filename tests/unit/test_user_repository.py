@@ -144,6 +144,29 @@ class TestUserRepository:
             passwordHash="testPassword123"
         )
 
+    @pytest.mark.unit
+    def testCreateManyUsers(self):
+        """测试批量创建用户"""
+        # 设置模拟返回值
+        self.mockDb.addUsers.return_value = [1, 2]
+        otherUser = User(
+            username="otherUser",
+            email="other@example.com",
+            passwordHash="otherPassword123"
+        )
+
+        # 执行测试
+        result = self.userRepo.createMany([self.sampleUser, otherUser])
+
+        # 验证结果
+        assert [user.id for user in result] == [1, 2]
+
+        # 验证数据库调用：一次批量写入
+        self.mockDb.addUsers.assert_called_once_with([
+            ("testUser", "test@example.com", "testPassword123"),
+            ("otherUser", "other@example.com", "otherPassword123")
+        ])
+
     @pytest.mark.unit
     def testGetUserById(self):
         """测试根据ID获取用户"""
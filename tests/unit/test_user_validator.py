@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+用户数据验证器单元测试
+
+测试用户名、邮箱、密码的验证规则（不依赖 Qt）
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+
+# 添加src目录到Python路径
+src_path = Path(__file__).parent.parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from business.validators.user_validator import UserValidator  # noqa: E402
+
+
+class TestUserValidator:
+    """用户数据验证器测试类"""
+
+    @pytest.mark.unit
+    def testPasswordCharClassesUnicode(self):
+        """测试密码字符类别按 Unicode 字符属性判断"""
+        # 非 ASCII 的大写字母、小写字母和数字同样计入对应类别
+        assert UserValidator._passwordCharClasses("É") == (True, False, False, False)
+        assert UserValidator._passwordCharClasses("é") == (False, True, False, False)
+        assert UserValidator._passwordCharClasses("٣") == (False, False, True, False)
+        assert UserValidator._passwordCharClasses("²") == (False, False, True, False)
+        # '½' 是数值字符但不是数字，也不属于其他类别
+        assert UserValidator._passwordCharClasses("½") == (False, False, False, False)
+        assert UserValidator._passwordCharClasses("!") == (False, False, False, True)
+
+    @pytest.mark.unit
+    def testValidatePasswordUnicode(self):
+        """测试包含非 ASCII 字符的密码强度验证"""
+        assert UserValidator.validatePassword("ÉCOLEécole٣") is True
+        assert UserValidator.validatePassword("écoleécole٣") is False
+        assert UserValidator.validatePassword("½½½½abcdEF") is False
+        assert UserValidator.validatePassword("Password123") is True
+        assert UserValidator.validatePassword("password!!") is False
+
+    @pytest.mark.unit
+    def testPasswordStrengthScoreUnicode(self):
+        """测试密码强度评分识别非 ASCII 字符类别"""
+        result = UserValidator.getPasswordStrengthScore("ÉCOLEécole٣")
+
+        assert result['score'] == 85
+        assert result['strength'] == 'strong'
+        assert result['suggestions'] == ["添加特殊字符"]
+
+    @pytest.mark.unit
+    def testValidateUsernamesBatch(self):
+        """测试批量验证用户名与逐个验证结果一致"""
+        inputs = [
+            "testUser",
+            None,
+            12345,
+            "",
+            "  padded_user  ",
+            "   ",
+            "ab",
+            "a" * 30,
+            "a" * 31,
+            "user-name_1",
+            "bad name",
+            "bad@name",
+            "用户名",
+        ]
+
+        results = UserValidator.validateUsernamesBatch(inputs)
+
+        assert results == [UserValidator.validateUsername(u) for u in inputs]
+        assert results == [
+            True, False, False, False, True, False, False,
+            True, False, True, False, False, False
+        ]
+
+    @pytest.mark.unit
+    def testValidateEmailMaxLength(self):
+        """测试邮箱长度上限（RFC 5321 的254个字符）"""
+        domain = "@example.com"
+        longestEmail = "a" * (254 - len(domain)) + domain
+        tooLongEmail = "a" * (255 - len(domain)) + domain
+
+        assert len(longestEmail) == 254
+        assert UserValidator.validateEmail(longestEmail) is True
+        # 格式本身合法，仅因超过长度上限被拒绝
+        assert UserValidator.emailPattern.match(tooLongEmail)
+        assert UserValidator.validateEmail(tooLongEmail) is False
+        # 长度按去除首尾空白后计算
+        assert UserValidator.validateEmail(f"  {longestEmail}  ") is True